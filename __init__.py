@@ -22,6 +22,8 @@ from .propagation import (
 	winner2_pathloss_db,
 	itm_pathloss_db,
     two_slope_pathloss_db,
+    clear_pathloss_caches,
+    extra_loss_db,
 )
 from .kpi import inr_violation_probability, grant_stats
 from .spec_params import (
@@ -42,6 +44,8 @@ from .phy_mcs import (
 from .scenario import (
 	Scenario,
 	run_scenario,
+	run_scenario_np,
+	save_scenario_csv,
 	rows_to_table,
 	print_table,
 )
@@ -49,9 +53,11 @@ from .grant_table import (
     GrantRow,
     enumerate_centers_mhz,
     channel_number_from_center_mhz,
+    channel_numbers_from_centers_mhz,
     build_grant_table_for_hypothetical_fs,
     build_grant_table_both_blocks,
     build_grant_table_with_incumbents,
+    evaluate_channels_batch,
     grant_rows_to_table,
     save_grant_table_csv,
 )
@@ -104,6 +110,8 @@ __all__ = [
 	"winner2_pathloss_db",
 	"itm_pathloss_db",
     "two_slope_pathloss_db",
+    "clear_pathloss_caches",
+    "extra_loss_db",
 	"inr_violation_probability",
     "grant_stats",
 	"SpecParameters",
@@ -119,14 +127,18 @@ __all__ = [
 	"phy_rate_bps_from_snr_db",
 	"Scenario",
 	"run_scenario",
+	"run_scenario_np",
+	"save_scenario_csv",
 	"rows_to_table",
 	"print_table",
     "GrantRow",
     "enumerate_centers_mhz",
     "channel_number_from_center_mhz",
+    "channel_numbers_from_centers_mhz",
     "build_grant_table_for_hypothetical_fs",
     "build_grant_table_both_blocks",
     "build_grant_table_with_incumbents",
+    "evaluate_channels_batch",
     "grant_rows_to_table",
     "save_grant_table_csv",
     "AntennaPatternParams",
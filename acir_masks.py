@@ -13,6 +13,8 @@ WINNF-TS-1014 references:
 
 from typing import Iterable, List, Tuple, Dict
 
+import numpy as np
+
 from .acir import acir_db
 
 
@@ -33,20 +35,12 @@ def interpolate_mask_db(offset_mhz: float, mask_points: Iterable[Tuple[float, fl
 
     If offset is below the first point, return the first point's attenuation.
     If above last, return the last point's attenuation (flat extrapolation).
+    np.interp clamps to the end points itself, so there is no boundary branching.
     """
     pts = _sorted_points(mask_points)
     if not pts:
         raise ValueError("mask_points must not be empty")
-    x = float(offset_mhz)
-    if x <= pts[0][0]:
-        return pts[0][1]
-    for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
-        if x0 <= x <= x1:
-            if abs(x1 - x0) < 1e-12:
-                return y0
-            t = (x - x0) / (x1 - x0)
-            return y0 + t * (y1 - y0)
-    return pts[-1][1]
+    return float(np.interp(float(offset_mhz), [p[0] for p in pts], [p[1] for p in pts]))
 
 
 def acir_db_from_masks(
@@ -66,6 +60,26 @@ def acir_db_from_masks(
     return acir_db(a_tx, a_rx)
 
 
+def acir_db_from_masks_vec(
+    offsets_mhz,
+    tx_mask_points: Iterable[Tuple[float, float]],
+    rx_acs_points: Iterable[Tuple[float, float]],
+) -> np.ndarray:
+    """Vectorized acir_db_from_masks over an array of offsets (MHz).
+
+    The masks are sorted once and evaluated with np.interp, which gives the same
+    linear interpolation with flat extrapolation beyond the end points.
+    """
+    tx = _sorted_points(tx_mask_points)
+    rx = _sorted_points(rx_acs_points)
+    if not tx or not rx:
+        raise ValueError("mask_points must not be empty")
+    x = np.asarray(offsets_mhz, dtype=float)
+    a_tx = np.interp(x, [p[0] for p in tx], [p[1] for p in tx])
+    a_rx = np.interp(x, [p[0] for p in rx], [p[1] for p in rx])
+    return 10.0 * np.log10(1.0 / (10.0 ** (-a_tx / 10.0) + 10.0 ** (-a_rx / 10.0)))
+
+
 def acir_profile_from_tables(
     tx_table: Dict[int, float],
     rx_table: Dict[int, float],
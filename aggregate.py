@@ -7,14 +7,16 @@ and evaluate INR vs the -6 dB criterion (WINNF-TS-1014 9.1.1 aggregate context).
 from typing import Iterable, Dict, Any, List
 import math
 
+import numpy as np
+
 from .spec_params import SpecParameters
-from .link_budget import noise_power_dbm
-from .propagation import select_pathloss_db
-from .geodesy import haversine_distance_m, initial_bearing_deg
-from .antenna import AntennaPatternParams, off_axis_azimuth_deg, effective_gain_dbi
+from .link_budget import noise_power_dbm, db_to_lin
+from .propagation import select_pathloss_db_vec
+from .geodesy import haversine_distance_matrix_m, initial_bearing_deg_vec
+from .antenna import off_axis_azimuth_deg_vec, effective_gain_dbi_vec
 from .antenna_rpe import combined_rpe_gain_dbi
-from .acir_defaults import ensure_defaults
-from .acir_masks import acir_db_from_masks
+from .acir_masks import acir_db_from_masks_vec
+from .incumbent_table import normalize_incumbents
 
 
 def lin_from_dbm(dbm: float) -> float:
@@ -67,73 +69,51 @@ def evaluate_aggregate_inr_for_channel(
 
     Returns a summary dict with worst-case INR across incumbents and details per incumbent.
     """
-    a_tx_def, a_rx_def = ensure_defaults(spec.acir.a_tx_db_by_offset_mhz, spec.acir.a_rx_db_by_offset_mhz)
-    tx_points = sorted((float(k), float(v)) for k, v in a_tx_def.items())
-    rx_points = sorted((float(k), float(v)) for k, v in a_rx_def.items())
+    table = normalize_incumbents(
+        incumbents, spec.incumbent.antenna_gain_dbi, default_bw_mhz=spec.incumbent.bandwidth_hz / 1e6
+    )
+    ap_list = list(aps)
+    ap_lats = np.array([float(ap["lat"]) for ap in ap_list], dtype=float)  # required
+    ap_lons = np.array([float(ap["lon"]) for ap in ap_list], dtype=float)  # required
+    ap_eirps = np.array([float(ap["eirp_dbm"]) for ap in ap_list], dtype=float)  # required
 
     f_hz = center_mhz * 1e6
     ch_lo = center_mhz - bandwidth_mhz / 2.0
     ch_hi = center_mhz + bandwidth_mhz / 2.0
 
+    # Noise power at FS
+    n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
+
+    # (incumbent x AP) geometry and path loss in one pass
+    d_m = haversine_distance_matrix_m(ap_lats, ap_lons, table.lat, table.lon).T
+    brg = initial_bearing_deg_vec(ap_lats[None, :], ap_lons[None, :], table.lat[:, None], table.lon[:, None])
+    pl_db = select_pathloss_db_vec(d_m, f_hz, environment=environment)
+
+    # Antenna discrimination (azimuth only) at FS side
+    delta_az = off_axis_azimuth_deg_vec(table.rx_az_deg[:, None], (brg + 180.0) % 360.0)
+    g_eff = effective_gain_dbi_vec(table.rx_gain_dbi[:, None], delta_az, 0.0)
+    for i in np.flatnonzero(table.has_rpe):
+        for j in range(len(ap_list)):
+            g_eff[i, j] = combined_rpe_gain_dbi(float(table.rx_gain_dbi[i]), float(delta_az[i, j]), 0.0, table.rpe_az[i], table.rpe_el[i])
+
+    i_co_dbm = ap_eirps[None, :] - pl_db + g_eff - spec.incumbent.rx_losses_db + spec.incumbent.polarization_mismatch_db
+
+    # Co-channel when the FS band overlaps the channel; otherwise ACIR at the center offset
+    fs_lo = table.center_mhz - table.bw_mhz / 2.0
+    fs_hi = table.center_mhz + table.bw_mhz / 2.0
+    overlaps = np.minimum(ch_hi, fs_hi) - np.maximum(ch_lo, fs_lo)
+    acir_val = acir_db_from_masks_vec(np.abs(center_mhz - table.center_mhz), spec.acir.tx_points, spec.acir.rx_points)
+    i_dbm = np.where(overlaps[:, None] > 0, i_co_dbm, i_co_dbm - acir_val[:, None])
+
+    # Sum interference from all APs in the linear domain, per incumbent
+    i_agg_mw = np.sum(db_to_lin(i_dbm), axis=1).tolist()
+
     details: List[Dict[str, Any]] = []
     worst_inr = -1e9
     worst_id = None
-
-    for inc in incumbents:
-        # Tolerant field access
-        def _v(d: dict, keys: list[str], default=None):
-            for k in keys:
-                if k in d and d[k] is not None:
-                    return d[k]
-            return default
-
-        fs_center_mhz = float(_v(inc, ["freq_center_mhz", "center_mhz", "fs_center_mhz"]))
-        fs_bw_mhz = float(_v(inc, ["bandwidth_mhz", "fs_bandwidth_mhz", "rx_bw_mhz"], spec.incumbent.bandwidth_hz / 1e6))
-        rx_lat = float(_v(inc, ["rx_lat", "lat"], 0.0))
-        rx_lon = float(_v(inc, ["rx_lon", "lon"], 0.0))
-        fs_rx_gain = float(_v(inc, ["rx_antenna_gain_dbi", "rx_gain_dbi"], spec.incumbent.antenna_gain_dbi))
-        rx_az = float(_v(inc, ["rx_antenna_azimuth_deg", "rx_azimuth_deg", "az_deg"], 0.0))
-        pol = str(_v(inc, ["polarization"], ""))[:1].upper()
-        rpe_az = inc.get("rx_rpe_az")
-        rpe_el = inc.get("rx_rpe_el")
-        link_id = str(_v(inc, ["link_id", "fs_id", "id"], "unknown"))
-
-        fs_lo = fs_center_mhz - fs_bw_mhz / 2.0
-        fs_hi = fs_center_mhz + fs_bw_mhz / 2.0
-        overlaps = min(ch_hi, fs_hi) - max(ch_lo, fs_lo)
-
-        # Noise power at FS
-        n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
-
-        # Sum interference from all APs
-        i_components: List[float] = []
-        for ap in aps:
-            ap_lat = float(ap["lat"])  # required
-            ap_lon = float(ap["lon"])  # required
-            eirp_dbm = float(ap["eirp_dbm"])  # required
-
-            d_m = haversine_distance_m(ap_lat, ap_lon, rx_lat, rx_lon)
-            brg = initial_bearing_deg(ap_lat, ap_lon, rx_lat, rx_lon)
-            pl_db = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=environment)
-
-            # Antenna discrimination (azimuth only) at FS side
-            delta_az = off_axis_azimuth_deg(rx_az, (brg + 180.0) % 360.0)
-            if rpe_az and rpe_el:
-                g_eff = combined_rpe_gain_dbi(fs_rx_gain, delta_az, 0.0, rpe_az, rpe_el)
-            else:
-                g_eff = effective_gain_dbi(AntennaPatternParams(g_max_dbi=fs_rx_gain), delta_az, 0.0)
-
-            i_co_dbm = eirp_dbm - pl_db + g_eff - spec.incumbent.rx_losses_db + spec.incumbent.polarization_mismatch_db
-
-            if overlaps > 0:
-                i_components.append(i_co_dbm)
-            else:
-                offset = abs(center_mhz - fs_center_mhz)
-                acir_val = acir_db_from_masks(offset, tx_points, rx_points)
-                i_components.append(i_co_dbm - acir_val)
-
-        inr_db = inr_db_from_components(i_components, n_dbm)
-        details.append({"incumbent": link_id, "inr_db": inr_db, "num_aps": len(list(aps))})
+    for link_id, total_mw in zip(table.link_id, i_agg_mw):
+        inr_db = dbm_from_lin(total_mw) - n_dbm
+        details.append({"incumbent": link_id, "inr_db": inr_db, "num_aps": len(ap_list)})
         if inr_db > worst_inr:
             worst_inr = inr_db
             worst_id = link_id
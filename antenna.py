@@ -17,6 +17,8 @@ cap at a backlobe floor.
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class AntennaPatternParams:
@@ -42,6 +44,12 @@ def off_axis_azimuth_deg(antenna_azimuth_deg: float, bearing_to_target_deg: floa
     return d
 
 
+def off_axis_azimuth_deg_vec(antenna_azimuth_deg, bearing_to_target_deg) -> np.ndarray:
+    """Vectorized off_axis_azimuth_deg over NumPy-broadcastable inputs."""
+    d = np.asarray(bearing_to_target_deg, dtype=float) - np.asarray(antenna_azimuth_deg, dtype=float)
+    return np.abs(((d + 180.0) % 360.0) - 180.0)
+
+
 def _attenuation_parabolic(delta_deg: float, hpbw_deg: float, sidelobe_floor_db: float) -> float:
     if hpbw_deg <= 0:
         return sidelobe_floor_db
@@ -69,3 +77,23 @@ def effective_gain_dbi(
     g = pattern.g_max_dbi - (a_az + a_el)
     return max(g, pattern.backlobe_floor_dbi)
 
+
+def effective_gain_dbi_vec(
+    g_max_dbi,
+    azimuth_offaxis_deg,
+    elevation_offaxis_deg,
+    pattern: AntennaPatternParams = AntennaPatternParams(),
+) -> np.ndarray:
+    """Vectorized effective_gain_dbi with per-element boresight gain.
+
+    Beamwidths and floors come from `pattern` (its g_max_dbi is ignored).
+    """
+    def _att(delta, hpbw):
+        if hpbw <= 0:
+            return np.full(np.shape(delta), pattern.sidelobe_floor_db)
+        return np.minimum(12.0 * (delta / hpbw) ** 2, pattern.sidelobe_floor_db)
+
+    a_az = _att(np.abs(np.asarray(azimuth_offaxis_deg, dtype=float)), pattern.hpbw_az_deg)
+    a_el = _att(np.abs(np.asarray(elevation_offaxis_deg, dtype=float)), pattern.hpbw_el_deg)
+    g = np.asarray(g_max_dbi, dtype=float) - (a_az + a_el)
+    return np.maximum(g, pattern.backlobe_floor_dbi)
@@ -0,0 +1,33 @@
+"""Shared pytest setup for the spec-driven tests.
+
+The spec text and example incumbents are read once per test session instead of
+once per test. The project root is put on sys.path once here (for the
+`core.*` imports in tests/test_afc_phy.py) rather than by each test module.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import afc_new as afc
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+
+@pytest.fixture(scope="session")
+def afc_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def afc_params(afc_root):
+    return afc.load_params_from_text_file(afc_root / "spec" / "extracted_afc_text.txt")
+
+
+@pytest.fixture(scope="session")
+def incumbents_json(afc_root):
+    return json.loads((afc_root / "spec" / "example_incumbents.json").read_text(encoding="utf-8"))
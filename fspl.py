@@ -9,6 +9,8 @@ as LoS baseline). This file supports those calculations.
 
 import math
 
+import numpy as np
+
 _FOUR_PI = 4.0 * math.pi
 _C = 2.99792458e8  # m/s
 
@@ -26,6 +28,16 @@ def fspl_db(distance_m: float, frequency_hz: float) -> float:
     return 20.0 * math.log10(x)
 
 
+def fspl_db_vec(distance_m, frequency_hz) -> np.ndarray:
+    """Vectorized fspl_db over NumPy-broadcastable distance/frequency inputs."""
+    d = np.asarray(distance_m, dtype=float)
+    f = np.asarray(frequency_hz, dtype=float)
+    if np.any(d <= 0) or np.any(f <= 0):
+        raise ValueError("distance and frequency must be positive")
+    x = _FOUR_PI * d * f / _C
+    return 20.0 * np.log10(x)
+
+
 def invert_fspl_distance_m(fspl_db_value: float, frequency_hz: float) -> float:
     """Invert FSPL to distance: d = (c/(4π f)) · 10^{FSPL/20}.
 
@@ -6,6 +6,8 @@ FS receiver location (WINNF-TS-1014 9.1.1 evaluation point).
 
 import math
 
+import numpy as np
+
 
 def haversine_distance_m(lat1_deg: float, lon1_deg: float, lat2_deg: float, lon2_deg: float) -> float:
     """Great-circle distance between two WGS-84 points in meters.
@@ -28,6 +30,37 @@ def haversine_distance_m(lat1_deg: float, lon1_deg: float, lat2_deg: float, lon2
     return r_earth_m * c
 
 
+def haversine_distance_m_vec(lat1_deg, lon1_deg, lat2_deg, lon2_deg) -> np.ndarray:
+    """Vectorized haversine_distance_m over NumPy-broadcastable inputs.
+
+    Typical use is one AP location against arrays of FS receiver coordinates so
+    all AP→FS distances of a request come out of a single pass.
+    """
+    r_earth_m = 6371000.0
+    lat1 = np.radians(np.asarray(lat1_deg, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1_deg, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2_deg, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2_deg, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2.0) ** 2
+    c = 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+    return r_earth_m * c
+
+
+def haversine_distance_matrix_m(lats1_deg, lons1_deg, lats2_deg, lons2_deg) -> np.ndarray:
+    """Pairwise great-circle distances in meters, shape (len(lats1), len(lats2)).
+
+    Row i / column j is haversine_distance_m(lats1[i], lons1[i], lats2[j], lons2[j]),
+    e.g. every AP against every FS receiver in one call.
+    """
+    lat1 = np.asarray(lats1_deg, dtype=np.float64).reshape(-1, 1)
+    lon1 = np.asarray(lons1_deg, dtype=np.float64).reshape(-1, 1)
+    lat2 = np.asarray(lats2_deg, dtype=np.float64).reshape(1, -1)
+    lon2 = np.asarray(lons2_deg, dtype=np.float64).reshape(1, -1)
+    return haversine_distance_m_vec(lat1, lon1, lat2, lon2)
+
+
 def initial_bearing_deg(lat1_deg: float, lon1_deg: float, lat2_deg: float, lon2_deg: float) -> float:
     """Initial bearing from point 1 to point 2 (degrees 0..360).
 
@@ -42,3 +75,12 @@ def initial_bearing_deg(lat1_deg: float, lon1_deg: float, lat2_deg: float, lon2_
     return (brng + 360.0) % 360.0
 
 
+def initial_bearing_deg_vec(lat1_deg, lon1_deg, lat2_deg, lon2_deg) -> np.ndarray:
+    """Vectorized initial_bearing_deg over NumPy-broadcastable inputs (degrees 0..360)."""
+    lat1 = np.radians(np.asarray(lat1_deg, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2_deg, dtype=np.float64))
+    dlon = np.radians(np.asarray(lon2_deg, dtype=np.float64) - np.asarray(lon1_deg, dtype=np.float64))
+    x = np.sin(dlon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    brng = np.degrees(np.arctan2(x, y))
+    return (brng + 360.0) % 360.0
@@ -35,18 +35,22 @@ from typing import Iterable, List, Tuple
 import csv
 from pathlib import Path
 
+import numpy as np
+
 from .spec_params import SpecParameters
-from .propagation import select_pathloss_db
+from .propagation import select_pathloss_db, select_pathloss_db_vec
 from .link_budget import noise_power_dbm
 from .fs_bandwidth import determine_fs_noise_bw_hz
 from .allocator import allowed_eirp_dbm_with_spec, allowed_eirp_dbm_with_spec_multi, psd_dbm_per_mhz_from_eirp
-from .acir_masks import acir_db_from_masks
-from .acir_defaults import ensure_defaults
-from .geodesy import haversine_distance_m, initial_bearing_deg
-from .antenna import AntennaPatternParams, off_axis_azimuth_deg, effective_gain_dbi
-from .antenna_rpe import combined_rpe_gain_dbi
+from .acir_masks import acir_db_from_masks, acir_db_from_masks_vec
+from .geodesy import haversine_distance_m_vec
 from .itm import longley_rice_pathloss_db
 from .device_constraints import DeviceConstraints, apply_constraints_to_decision
+from .kernels import HAVE_NUMBA, grant_min_eirp_kernel
+
+
+# path_model -> select_pathloss_db selector ("two_slope"/"auto" use the default split)
+_PL_SELECTOR = {"fspl": "fspl", "winner": "winner2"}
 
 
 # The Wi‑Fi 6 GHz 20 MHz channel grid uses a center at 5955 MHz for channel 1
@@ -63,21 +67,23 @@ def enumerate_centers_mhz(lower_mhz: float, upper_mhz: float, bandwidth_mhz: flo
 	we step the centers by the bandwidth.
 	"""
 	grid_origin_mhz = 5955.0
-	centers: List[float] = []
+	if bandwidth_mhz <= 0:
+		raise ValueError("bandwidth_mhz must be positive")
 	# Find the first center at or above lower_mhz that is aligned to the bandwidth step
 	# and also lies on the 5 MHz grid offset from 5955.
 	step = bandwidth_mhz
 	# Start by snapping to the next step boundary relative to origin
 	n0 = int((lower_mhz - grid_origin_mhz + step - 1e-9) // step)
-	c = grid_origin_mhz + n0 * step
-	while c + bandwidth_mhz / 2.0 <= upper_mhz:
-		# Ensure the entire channel fits in [lower, upper]
-		lo = c - bandwidth_mhz / 2.0
-		hi = c + bandwidth_mhz / 2.0
-		if lo >= lower_mhz - 1e-9 and hi <= upper_mhz + 1e-9:
-			centers.append(c)
-		c += step
-	return centers
+	# Candidate grid steps from n0 up to (a little past) the last channel ending at upper_mhz
+	n1 = int((upper_mhz - bandwidth_mhz / 2.0 - grid_origin_mhz) // step) + 2
+	c = grid_origin_mhz + np.arange(n0, max(n0, n1), dtype=float) * step
+	lo = c - bandwidth_mhz / 2.0
+	hi = c + bandwidth_mhz / 2.0
+	# Ensure the entire channel fits in [lower, upper]. The upper bound is exact, not
+	# widened by 1e-9: the old while loop stopped at the first hi > upper_mhz, which made
+	# its inner "hi <= upper_mhz + 1e-9" check unreachable slack
+	keep = (lo >= lower_mhz - 1e-9) & (hi <= upper_mhz)
+	return c[keep].tolist()
 
 
 def channel_number_from_center_mhz(center_mhz: float) -> int:
@@ -90,6 +96,12 @@ def channel_number_from_center_mhz(center_mhz: float) -> int:
 	return int(round(1 + (center_mhz - 5955.0) / 5.0))
 
 
+def channel_numbers_from_centers_mhz(centers_mhz) -> np.ndarray:
+	"""Vectorized channel_number_from_center_mhz (int64 array; same half-even rounding)."""
+	c = np.asarray(centers_mhz, dtype=float)
+	return np.rint(1 + (c - 5955.0) / 5.0).astype(np.int64)
+
+
 @dataclass
 class GrantRow:
 	"""One line of the grant table for a (channel, bandwidth) entry."""
@@ -136,6 +148,14 @@ def build_grant_table_for_hypothetical_fs(
 		bandwidths_mhz: channel widths to consider (20/40/80/160)
 		inr_limit_db: protection criterion (default -6 dB)
 	"""
+	# FS noise (using FS bandwidth from spec; we could refine later) is the same for every channel
+	n_bw = determine_fs_noise_bw_hz(
+		spec=spec,
+		emission_designator=emission_designator,
+		explicit_rx_bw_hz=override_fs_bandwidth_hz,
+		ul_bandwidth_hz=None,
+	)
+	n_dbm = noise_power_dbm(n_bw, spec.incumbent.noise_figure_db)
 	rows: List[GrantRow] = []
 	for bw in bandwidths_mhz:
 		for center in enumerate_centers_mhz(lower_mhz, upper_mhz, bw):
@@ -144,14 +164,6 @@ def build_grant_table_for_hypothetical_fs(
 			# Compute path loss at this channel's center frequency
 			f_hz = center * 1e6
 			pl_db = select_pathloss_db(distance_m=distance_m, frequency_hz=f_hz, environment=environment, indoor=indoor, penetration_db=penetration_db)
-			# Compute FS noise (using FS bandwidth from spec; we could refine later)
-			n_bw = determine_fs_noise_bw_hz(
-				spec=spec,
-				emission_designator=emission_designator,
-				explicit_rx_bw_hz=override_fs_bandwidth_hz,
-				ul_bandwidth_hz=None,
-			)
-			n_dbm = noise_power_dbm(n_bw, spec.incumbent.noise_figure_db)
 			# Determine spectral overlap to decide co-channel vs adjacent handling
 			ch_bw_mhz = bw
 			fs_bw_mhz = n_bw / 1e6
@@ -174,10 +186,7 @@ def build_grant_table_for_hypothetical_fs(
 				)
 			else:
 				# Adjacent: compute ACIR at the actual offset via mask interpolation
-				a_tx, a_rx = ensure_defaults(spec.acir.a_tx_db_by_offset_mhz, spec.acir.a_rx_db_by_offset_mhz)
-				tx_points = sorted((float(k), float(v)) for k, v in a_tx.items())
-				rx_points = sorted((float(k), float(v)) for k, v in a_rx.items())
-				acir_val = acir_db_from_masks(offset, tx_points, rx_points)
+				acir_val = acir_db_from_masks(offset, spec.acir.tx_points, spec.acir.rx_points)
 				eirp_dbm = allowed_eirp_dbm_with_spec(
 					n_dbm=n_dbm,
 					inr_limit_db=inr_limit_db - protection_margin_db,
@@ -253,31 +262,12 @@ def build_grant_table_both_blocks(
 	return rows
 
 
-def build_grant_table_with_incumbents(
-    spec: SpecParameters,
-    incumbents: Iterable[dict],
-    distance_m: float | None = None,
-    ap_lat: float | None = None,
-    ap_lon: float | None = None,
-    lower_mhz: float = 5925.0,
-    upper_mhz: float = 6425.0,
-    bandwidths_mhz: Iterable[float] = (20.0, 40.0, 80.0, 160.0),
-    inr_limit_db: float = -6.0,
-    environment: str | None = None,
-    path_model: str = "auto",  # "auto"|"fspl"|"winner"|"two_slope"|"itm"
-    device_constraints: DeviceConstraints | None = None,
-    indoor: bool = False,
-    penetration_db: float | None = None,
-	protection_margin_db: float = 0.0,
-) -> List[GrantRow]:
-    """Compute a single grant table considering all incumbents simultaneously.
+def _normalize_incumbent_sites(spec: SpecParameters, incumbents: Iterable[dict]) -> List[tuple]:
+    """Resolve incumbent field aliases and expand passive sites, one tuple per FS receiver.
 
-    For each Wi‑Fi channel, we compute the allowed EIRP against each incumbent and
-    take the minimum (most restrictive). Co-channel is triggered by spectral overlap
-    (channel and FS bandwidths overlap); otherwise ACIR is applied at the actual
-    center frequency offset using mask interpolation.
+    The result can be passed back to build_grant_table_with_incumbents with
+    pre_normalized=True to skip this step (e.g. once per spectrum inquiry).
     """
-    # Precompute incumbents derived params
     def _v(d: dict, keys: list[str], default=None):
         for k in keys:
             if k in d and d[k] is not None:
@@ -335,6 +325,121 @@ def build_grant_table_with_incumbents(
                     rx_h_val=ps.get("height_m", _v(inc, ["rx_antenna_height_m", "rx_height_m", "height_m"])),
                     suffix=f":PS{idx}",
                 )
+    return inc_params
+
+
+def _site_distances_m(
+    inc_params: List[tuple],
+    distance_m: float | None,
+    ap_lat: float | None,
+    ap_lon: float | None,
+) -> List[float]:
+    """AP→FS distance per site: distance_m for every site when given, otherwise
+    the haversine distance from the AP location (one vectorized pass)."""
+    if distance_m is not None:
+        return [distance_m] * len(inc_params)
+    lat0 = ap_lat if ap_lat is not None else 41.0
+    lon0 = ap_lon if ap_lon is not None else 29.0
+    site_lats = [p[3] for p in inc_params]
+    site_lons = [p[4] for p in inc_params]
+    return haversine_distance_m_vec(lat0, lon0, site_lats, site_lons).tolist()
+
+
+def _site_band_arrays(inc_params: List[tuple]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """FS center, lower/upper band edge (MHz) and polarization loss (dB) per site."""
+    site_centers = np.asarray([p[0] for p in inc_params], dtype=float)
+    site_bws = np.asarray([p[1] for p in inc_params], dtype=float)
+    # Placeholder cross-pol discrimination for H/V polarized receivers
+    site_pol_loss = np.asarray([3.0 if p[6] in ("H","V") else 0.0 for p in inc_params], dtype=float)
+    return site_centers, site_centers - site_bws / 2.0, site_centers + site_bws / 2.0, site_pol_loss
+
+
+# Block sizes for _min_eirp_tiled: a (32 x 64) float64 tile is 16 KB, so the
+# handful of temporaries per tile stay cache resident
+_CH_BLOCK = 32
+_SITE_BLOCK = 64
+
+
+def _min_eirp_tiled(
+    pl_db: np.ndarray,
+    adjacent: np.ndarray,
+    acir_db_mat: np.ndarray,
+    site_pol_loss_db: np.ndarray,
+    i_thresh_dbm: float,
+    g_rx_dbi: float,
+    l_rx_db: float,
+    max_eirp_dbm: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy version of kernels.grant_min_eirp_kernel, evaluated in cache-sized tiles.
+
+    Returns (best_eirp_dbm, limiting_site) per channel; limiting_site is the first
+    site with the lowest EIRP below max EIRP, or -1 if there is none.
+    """
+    n_ch, n_site = pl_db.shape
+    best = np.full(n_ch, float(max_eirp_dbm))
+    arg = np.full(n_ch, -1, dtype=np.int64)
+    for c0 in range(0, n_ch, _CH_BLOCK):
+        c1 = min(c0 + _CH_BLOCK, n_ch)
+        for s0 in range(0, n_site, _SITE_BLOCK):
+            s1 = min(s0 + _SITE_BLOCK, n_site)
+            eirp = np.minimum(
+                i_thresh_dbm + pl_db[c0:c1, s0:s1] - g_rx_dbi + l_rx_db + site_pol_loss_db[None, s0:s1],
+                max_eirp_dbm,
+            )
+            eirp = np.where(adjacent[c0:c1, s0:s1], eirp + acir_db_mat[c0:c1, s0:s1], eirp)
+            j = np.argmin(eirp, axis=1)
+            v = eirp[np.arange(c1 - c0), j]
+            # Strictly lower only, so earlier site blocks win ties
+            better = v < best[c0:c1]
+            best[c0:c1] = np.where(better, v, best[c0:c1])
+            arg[c0:c1] = np.where(better, s0 + j, arg[c0:c1])
+    return best, arg
+
+
+def build_grant_table_with_incumbents(
+    spec: SpecParameters,
+    incumbents: Iterable[dict],
+    distance_m: float | None = None,
+    ap_lat: float | None = None,
+    ap_lon: float | None = None,
+    lower_mhz: float = 5925.0,
+    upper_mhz: float = 6425.0,
+    bandwidths_mhz: Iterable[float] = (20.0, 40.0, 80.0, 160.0),
+    inr_limit_db: float = -6.0,
+    environment: str | None = None,
+    path_model: str = "auto",  # "auto"|"fspl"|"winner"|"two_slope"|"itm"
+    device_constraints: DeviceConstraints | None = None,
+    indoor: bool = False,
+    penetration_db: float | None = None,
+	protection_margin_db: float = 0.0,
+    pre_normalized: bool = False,
+) -> List[GrantRow]:
+    """Compute a single grant table considering all incumbents simultaneously.
+
+    For each Wi‑Fi channel, we compute the allowed EIRP against each incumbent and
+    take the minimum (most restrictive). Co-channel is triggered by spectral overlap
+    (channel and FS bandwidths overlap); otherwise ACIR is applied at the actual
+    center frequency offset using mask interpolation.
+
+    With pre_normalized=True, `incumbents` is the site list returned by
+    _normalize_incumbent_sites rather than raw incumbent dicts.
+    """
+    # Precompute incumbents derived params (per FS receiver site)
+    inc_params = list(incumbents) if pre_normalized else _normalize_incumbent_sites(spec, incumbents)
+
+    # Only AP→FS distances enter the allowed EIRP; the FS gain is the spec's
+    # boresight gain (no off-axis discrimination), so no per-site gains are computed
+    site_distances_m = _site_distances_m(inc_params, distance_m, ap_lat, ap_lon)
+
+    # ACIR masks are fixed for the whole table; ACIR is evaluated per bandwidth for
+    # all (channel, site) offsets at once
+    site_centers, site_fs_lo, site_fs_hi, site_pol_loss = _site_band_arrays(inc_params)
+    g_rx_dbi = spec.incumbent.antenna_gain_dbi
+    l_rx_db = spec.incumbent.rx_losses_db
+    max_eirp_dbm = spec.wifi_limits.max_eirp_dbm
+    # FS noise and the I/N threshold depend only on the spec: once per table
+    n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
+    i_thr_dbm = n_dbm + (inr_limit_db - protection_margin_db)
 
     rows: List[GrantRow] = []
     for bw in bandwidths_mhz:
@@ -344,95 +449,65 @@ def build_grant_table_with_incumbents(
             centers_iter = [(lower_mhz + upper_mhz) / 2.0]
         else:
             centers_iter = enumerate_centers_mhz(lower_mhz, upper_mhz, bw)
-        for center in centers_iter:
+        centers_iter = list(centers_iter)
+        channel_numbers = channel_numbers_from_centers_mhz(centers_iter).tolist()
+        centers_arr = np.asarray(centers_iter, dtype=float)
+        acir_mat = acir_db_from_masks_vec(
+            np.abs(centers_arr[:, None] - site_centers[None, :]),
+            spec.acir.tx_points,
+            spec.acir.rx_points,
+        )
+        acir_rows = acir_mat.tolist()
+        # One (channels x sites) path-loss matrix per bandwidth
+        if not centers_iter or not inc_params:
+            pl_mat = np.zeros((len(centers_iter), len(inc_params)))
+        elif path_model == "itm":
+            pl_mat = np.asarray([
+                [
+                    longley_rice_pathloss_db(distance_m=d_m, frequency_hz=center * 1e6, tx_height_m=10.0, rx_height_m=(float(p[9]) if p[9] else None), climate=environment)
+                    for p, d_m in zip(inc_params, site_distances_m)
+                ]
+                for center in centers_iter
+            ], dtype=float)
+        else:
+            pl_mat = select_pathloss_db_vec(
+                np.asarray(site_distances_m, dtype=float)[None, :],
+                centers_arr[:, None] * 1e6,
+                selector=_PL_SELECTOR.get(path_model),
+                environment=environment,
+                indoor=indoor,
+                penetration_db=penetration_db,
+            )
+        pl_rows = pl_mat.tolist()
+        # Co-channel is triggered by spectral overlap; otherwise ACIR applies
+        adjacent = (
+            np.minimum(centers_arr[:, None] + bw / 2.0, site_fs_hi[None, :])
+            - np.maximum(centers_arr[:, None] - bw / 2.0, site_fs_lo[None, :])
+        ) <= 0
+        # Most restrictive EIRP and limiting site per channel
+        min_eirp = grant_min_eirp_kernel if HAVE_NUMBA else _min_eirp_tiled
+        ch_best, ch_arg = min_eirp(
+            np.ascontiguousarray(pl_mat, dtype=float), adjacent, acir_mat, site_pol_loss,
+            i_thr_dbm, g_rx_dbi, l_rx_db, max_eirp_dbm,
+        )
+        ch_best = ch_best.tolist()
+        ch_arg = ch_arg.tolist()
+        for ci, center in enumerate(centers_iter):
             f_hz = center * 1e6
-            # If a per-incumbent geographic distance is intended, pass None here and compute per FS below
-            pl_db = None
-            n_bw = spec.incumbent.bandwidth_hz
-            n_dbm = noise_power_dbm(n_bw, spec.incumbent.noise_figure_db)
-
-            # Evaluate per incumbent and keep the minimum allowed EIRP
-            best_eirp = spec.wifi_limits.max_eirp_dbm
+            best_eirp = ch_best[ci]
             best_pl_db = None
             limiting = None
             limiting_mode = None
             limiting_acir = None
-            for fs_center_mhz, fs_bw_mhz, fs_rx_gain, rx_lat, rx_lon, rx_az, pol, rpe_az, rpe_el, rx_h_m, link_id in inc_params:
-                offset = abs(center - fs_center_mhz)
-                ch_lo = center - bw / 2.0
-                ch_hi = center + bw / 2.0
-                fs_lo = fs_center_mhz - fs_bw_mhz / 2.0
-                fs_hi = fs_center_mhz + fs_bw_mhz / 2.0
-                overlaps = min(ch_hi, fs_hi) - max(ch_lo, fs_lo)
-
-                # Path loss for this incumbent: either use provided distance_m or compute from AP=FS Rx coords if available
-                if distance_m is not None:
-                    d_m = distance_m
-                    brg = None
-                else:
-                    # Use provided AP coordinates
-                    lat0 = ap_lat if ap_lat is not None else 41.0
-                    lon0 = ap_lon if ap_lon is not None else 29.0
-                    d_m = haversine_distance_m(lat0, lon0, rx_lat, rx_lon)
-                    brg = initial_bearing_deg(lat0, lon0, rx_lat, rx_lon)
-                # Path loss model selection
-                if path_model == "fspl":
-                    pl_db_inc = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=environment, selector="fspl", indoor=indoor, penetration_db=penetration_db)
-                elif path_model == "winner":
-                    pl_db_inc = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=environment, selector="winner2", indoor=indoor, penetration_db=penetration_db)
-                elif path_model == "two_slope":
-                    pl_db_inc = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=environment, indoor=indoor, penetration_db=penetration_db)
-                elif path_model == "itm":
-                    pl_db_inc = longley_rice_pathloss_db(distance_m=d_m, frequency_hz=f_hz, tx_height_m=10.0, rx_height_m=(float(rx_h_m) if rx_h_m else None), climate=environment)
-                else:  # auto
-                    pl_db_inc = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=environment, indoor=indoor, penetration_db=penetration_db)
-
-                # Apply simple FS antenna pattern discrimination using azimuth only
-                if brg is not None:
-                    delta_az = off_axis_azimuth_deg(rx_az, (brg + 180.0) % 360.0)
-                    if rpe_az and rpe_el:
-                        g_eff = combined_rpe_gain_dbi(fs_rx_gain, delta_az, 0.0, rpe_az, rpe_el)
-                    else:
-                        patt = AntennaPatternParams(g_max_dbi=fs_rx_gain)
-                        g_eff = effective_gain_dbi(patt, delta_az, 0.0)
-                else:
-                    g_eff = fs_rx_gain
-
-                if overlaps > 0:
-                    eirp = allowed_eirp_dbm_with_spec(
-                        n_dbm=n_dbm,
-                        inr_limit_db=inr_limit_db - protection_margin_db,
-                        path_loss_db=pl_db_inc,
-                        spec=spec,
-                        channel_offset_mhz=None,
-                        eirp_regulatory_max_dbm=None,
-                        l_polarization_db=(3.0 if pol in ("H","V") else 0.0),  # placeholder cross-pol discrimination
-                    )
-                    mode = "co"
-                    acir_used = None
+            si = ch_arg[ci]
+            if si >= 0:
+                best_pl_db = pl_rows[ci][si]
+                limiting = inc_params[si][10]
+                if adjacent[ci, si]:
+                    limiting_mode = "adj"
+                    limiting_acir = acir_rows[ci][si]
                 else:
-                    a_tx, a_rx = ensure_defaults(spec.acir.a_tx_db_by_offset_mhz, spec.acir.a_rx_db_by_offset_mhz)
-                    tx_points = sorted((float(k), float(v)) for k, v in a_tx.items())
-                    rx_points = sorted((float(k), float(v)) for k, v in a_rx.items())
-                    acir_val = acir_db_from_masks(offset, tx_points, rx_points)
-                    eirp = allowed_eirp_dbm_with_spec(
-                        n_dbm=n_dbm,
-                        inr_limit_db=inr_limit_db - protection_margin_db,
-                        path_loss_db=pl_db_inc,
-                        spec=spec,
-                        channel_offset_mhz=None,
-                        eirp_regulatory_max_dbm=None,
-                        l_polarization_db=(3.0 if pol in ("H","V") else 0.0),
-                    )
-                    eirp = eirp + acir_val
-                    mode = "adj"
-                    acir_used = acir_val
-                if eirp < best_eirp:
-                    best_eirp = eirp
-                    best_pl_db = pl_db_inc
-                    limiting = link_id
-                    limiting_mode = mode
-                    limiting_acir = acir_used
+                    limiting_mode = "co"
 
             # Fallback: if best_pl_db is still None (should not happen), approximate with
             # distance_m if provided or 3 km default
@@ -449,7 +524,7 @@ def build_grant_table_with_incumbents(
                 decision = "grant" if best_eirp >= 0.0 else "deny"
             rows.append(
                 GrantRow(
-                    channel_number=channel_number_from_center_mhz(center),
+                    channel_number=channel_numbers[ci],
                     center_mhz=center,
                     bandwidth_mhz=bw,
                     offset_mhz=0,
@@ -466,6 +541,71 @@ def build_grant_table_with_incumbents(
     return rows
 
 
+def evaluate_channels_batch(
+    spec: SpecParameters,
+    incumbents: Iterable[dict],
+    ap_lat: float,
+    ap_lon: float,
+    centers_mhz: Iterable[float],
+    bandwidths_mhz: Iterable[float],
+    inr_limit_db: float = -6.0,
+    environment: str | None = None,
+    path_model: str = "auto",
+    indoor: bool = False,
+    penetration_db: float | None = None,
+    protection_margin_db: float = 0.0,
+) -> np.ndarray:
+    """Allowed EIRP (dBm) for arbitrary (center, bandwidth) channels in one pass.
+
+    Entry i matches the allowed_eirp_dbm of a grant table built over just the
+    channel centers_mhz[i] / bandwidths_mhz[i] (e.g. spectrum_inquiry on that one
+    channel), but all channels are evaluated together as a (channels x sites)
+    grid. Results are in input order.
+    """
+    inc_params = _normalize_incumbent_sites(spec, incumbents)
+    centers = np.asarray(list(centers_mhz), dtype=float)
+    bws = np.asarray(list(bandwidths_mhz), dtype=float)
+    if bws.shape != centers.shape:
+        raise ValueError("centers_mhz and bandwidths_mhz must have the same length")
+    max_eirp_dbm = spec.wifi_limits.max_eirp_dbm
+    if not inc_params or centers.size == 0:
+        return np.full(centers.shape, float(max_eirp_dbm))
+
+    site_distances_m = _site_distances_m(inc_params, None, ap_lat, ap_lon)
+    site_centers, site_fs_lo, site_fs_hi, site_pol_loss = _site_band_arrays(inc_params)
+    if path_model == "itm":
+        pl_db = np.asarray([
+            [
+                longley_rice_pathloss_db(distance_m=d_m, frequency_hz=fc * 1e6, tx_height_m=10.0, rx_height_m=(float(p[9]) if p[9] else None), climate=environment)
+                for p, d_m in zip(inc_params, site_distances_m)
+            ]
+            for fc in centers.tolist()
+        ], dtype=float)
+    else:
+        pl_db = select_pathloss_db_vec(
+            np.asarray(site_distances_m, dtype=float)[None, :],
+            centers[:, None] * 1e6,
+            selector=_PL_SELECTOR.get(path_model),
+            environment=environment,
+            indoor=indoor,
+            penetration_db=penetration_db,
+        )
+
+    n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
+    i_thr_dbm = n_dbm + (inr_limit_db - protection_margin_db)
+    # allowed_eirp_dbm_with_spec per pair: I_thresh + PL − G_rx + L_rx + L_pol, capped;
+    # pairs without spectral overlap get ACIR on top of the capped value
+    eirp = np.minimum(
+        i_thr_dbm + pl_db - spec.incumbent.antenna_gain_dbi + spec.incumbent.rx_losses_db + site_pol_loss[None, :],
+        max_eirp_dbm,
+    )
+    half_bw = bws[:, None] / 2.0
+    overlaps = np.minimum(centers[:, None] + half_bw, site_fs_hi[None, :]) - np.maximum(centers[:, None] - half_bw, site_fs_lo[None, :])
+    acir_vals = acir_db_from_masks_vec(np.abs(centers[:, None] - site_centers[None, :]), spec.acir.tx_points, spec.acir.rx_points)
+    eirp = np.where(overlaps > 0, eirp, eirp + acir_vals)
+    return np.min(eirp, axis=1, initial=max_eirp_dbm)
+
+
 def grant_rows_to_table(rows: Iterable[GrantRow]) -> List[List[str]]:
 	"""Convert grant rows to a simple printable/CSV table."""
 	table = [[
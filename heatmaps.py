@@ -24,8 +24,13 @@ from typing import Iterable, List, Tuple
 import numpy as np
 import matplotlib.pyplot as plt
 
-from .propagation import select_pathloss_db
+from .propagation import select_pathloss_db_vec
 from .phy_mcs import phy_rate_bps_from_snr_db
+from .link_budget import db_to_lin, lin_to_db
+
+
+# path_model -> select_pathloss_db selector (anything else uses the default split)
+_PL_SELECTOR = {"fspl": "fspl", "winner": "winner2"}
 
 
 @dataclass(frozen=True)
@@ -78,61 +83,43 @@ def _generate_ap_heatmaps_core(
     xs = np.linspace(-R, R, nx)
     ys = np.linspace(-R, R, nx)
 
-    # Precompute client grid lat/lon
-    lons = np.zeros((nx, nx))
-    lats = np.zeros((nx, nx))
-    for iy, dy in enumerate(ys):
-        for ix, dx in enumerate(xs):
-            dlon, dlat = _meters_to_deg(center_lat, dx, dy)
-            lons[iy, ix] = center_lon + dlon
-            lats[iy, ix] = center_lat + dlat
+    # Client grid lat/lon (rows follow ys, columns xs)
+    dx_grid, dy_grid = np.meshgrid(xs, ys)
+    dlon, dlat = _meters_to_deg(center_lat, dx_grid, dy_grid)
+    lons = center_lon + dlon
+    lats = center_lat + dlat
 
     # Path loss and received powers per AP
     results: dict = {}
     f_hz = center_mhz * 1e6
 
-    # Compute received power grids from each AP at the client grid
-    pr_dbm_all = []  # list of 2D arrays per AP
-    for ap in ap_list:
-        pr = np.zeros((nx, nx))
-        for iy in range(nx):
-            for ix in range(nx):
-                # great-circle approx via local meters conversion; acceptable for small areas
-                dx_m = (lons[iy, ix] - ap.lon) * (111_320.0 * np.cos(np.radians(center_lat)))
-                dy_m = (lats[iy, ix] - ap.lat) * 111_320.0
-                d_m = np.hypot(dx_m, dy_m)
-                d_m = max(d_m, 1.0)
-                if path_model == "fspl":
-                    pl_db = select_pathloss_db(d_m, f_hz, environment=environment, selector="fspl")
-                elif path_model == "winner":
-                    pl_db = select_pathloss_db(d_m, f_hz, environment=environment, selector="winner2")
-                else:
-                    pl_db = select_pathloss_db(d_m, f_hz, environment=environment)
-                pr[iy, ix] = ap.eirp_dbm - pl_db + client_rx_gain_dbi
-        pr_dbm_all.append(pr)
+    # Received power grids from every AP at once, shape (n_ap, ny, nx).
+    # Great-circle approx via local meters conversion; acceptable for small areas
+    ap_lats = np.array([ap.lat for ap in ap_list], dtype=float)[:, None, None]
+    ap_lons = np.array([ap.lon for ap in ap_list], dtype=float)[:, None, None]
+    ap_eirp = np.array([ap.eirp_dbm for ap in ap_list], dtype=float)[:, None, None]
+    dx_m = (lons[None, :, :] - ap_lons) * (111_320.0 * np.cos(np.radians(center_lat)))
+    dy_m = (lats[None, :, :] - ap_lats) * 111_320.0
+    d_m = np.maximum(np.hypot(dx_m, dy_m), 1.0)
+    pl_db = select_pathloss_db_vec(d_m, f_hz, environment=environment, selector=_PL_SELECTOR.get(path_model))
+    pr_dbm_all = ap_eirp - pl_db + client_rx_gain_dbi
+    pr_mw_all = db_to_lin(pr_dbm_all)
 
     # For each AP, compute SINR and throughput with other APs as interference
     for idx, ap in enumerate(ap_list):
-        s_dbm = pr_dbm_all[idx]
         # Sum interference from others in linear mW
-        i_mw = np.zeros_like(s_dbm)
-        for jdx, pr in enumerate(pr_dbm_all):
-            if jdx == idx:
-                continue
-            i_mw += 10.0 ** (pr / 10.0)
+        others = np.arange(len(ap_list)) != idx
+        i_mw = pr_mw_all[others].sum(axis=0)
         n_mw = 10.0 ** (noise_dbm / 10.0)
-        s_mw = 10.0 ** (s_dbm / 10.0)
+        s_mw = pr_mw_all[idx]
         sinr_lin = s_mw / (i_mw + n_mw)
-        sinr_db = 10.0 * np.log10(np.maximum(sinr_lin, 1e-12))
+        sinr_db = lin_to_db(np.maximum(sinr_lin, 1e-12))
 
         # Throughput using PHY mapping (single spatial stream assumed)
-        tp_mbps = np.zeros_like(sinr_db)
-        for iy in range(nx):
-            for ix in range(nx):
-                mcs, per, rate_bps = phy_rate_bps_from_snr_db(
-                    float(sinr_db[iy, ix]), bw_hz, spatial_streams=1, mac_efficiency=mac_efficiency
-                )
-                tp_mbps[iy, ix] = rate_bps / 1e6
+        tp_mbps = np.array([
+            phy_rate_bps_from_snr_db(v, bw_hz, spatial_streams=1, mac_efficiency=mac_efficiency)[2] / 1e6
+            for v in sinr_db.ravel().tolist()
+        ]).reshape(sinr_db.shape)
 
         name = ap.name or f"AP_{idx+1}"
         results[name] = {"sinr_db": sinr_db, "tp_mbps": tp_mbps}
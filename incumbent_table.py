@@ -0,0 +1,106 @@
+"""Structure-of-arrays view of an incumbent list.
+
+Incumbent records arrive as dicts with several accepted spellings per field
+(e.g. "rx_lat" or "lat"). The per-request evaluation loops only need a handful
+of numeric fields, so `normalize_incumbents` resolves the aliases once and
+packs each field into a NumPy column; callers then index rows or broadcast
+whole columns instead of doing dict lookups per bin.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# Polarization codes for IncumbentTable.pol (uint8)
+POL_UNKNOWN = 0
+POL_H = 1
+POL_V = 2
+_POL_CODES = {"H": POL_H, "V": POL_V}
+
+
+@dataclass(frozen=True)
+class IncumbentTable:
+    """Parallel per-incumbent columns (row i describes incumbent i).
+
+    lat, lon: FS receiver location (deg)
+    center_mhz, bw_mhz: FS receiver channel
+    rx_gain_dbi, rx_az_deg: FS receiver antenna boresight gain and azimuth
+    pol: polarization code (POL_H, POL_V, or POL_UNKNOWN), uint8
+    pol_loss_db: 3 dB for H/V polarization, 0 otherwise
+    has_rpe: True where both RPE tables are given
+    rpe_az, rpe_el: RPE tables per row (None where absent)
+    link_id: link identifier per row ("unknown" if not given)
+    """
+    lat: np.ndarray
+    lon: np.ndarray
+    center_mhz: np.ndarray
+    bw_mhz: np.ndarray
+    rx_gain_dbi: np.ndarray
+    rx_az_deg: np.ndarray
+    pol: np.ndarray
+    pol_loss_db: np.ndarray
+    has_rpe: np.ndarray
+    rpe_az: List[Any]
+    rpe_el: List[Any]
+    link_id: List[str]
+
+    def __len__(self) -> int:
+        return self.center_mhz.shape[0]
+
+
+def _v(d: Dict[str, Any], keys: List[str], default=None):
+    for k in keys:
+        if k in d and d[k] is not None:
+            return d[k]
+    return default
+
+
+def normalize_incumbents(
+    incumbents: Iterable[Dict[str, Any]],
+    default_rx_gain_dbi: float,
+    default_bw_mhz: Optional[float] = None,
+) -> IncumbentTable:
+    """Resolve field aliases once and pack the incumbents into an IncumbentTable.
+
+    Missing center frequency (or bandwidth, unless default_bw_mhz is given)
+    raises TypeError, as the per-dict code did.
+    """
+    lat: List[float] = []
+    lon: List[float] = []
+    center: List[float] = []
+    bw: List[float] = []
+    gain: List[float] = []
+    az: List[float] = []
+    pol: List[int] = []
+    rpe_az: List[Any] = []
+    rpe_el: List[Any] = []
+    link_id: List[str] = []
+    for inc in incumbents:
+        center.append(float(_v(inc, ["freq_center_mhz", "center_mhz", "fs_center_mhz"])))
+        bw.append(float(_v(inc, ["bandwidth_mhz", "fs_bandwidth_mhz", "rx_bw_mhz"], default_bw_mhz)))
+        lat.append(float(_v(inc, ["rx_lat", "lat"], 0.0)))
+        lon.append(float(_v(inc, ["rx_lon", "lon"], 0.0)))
+        gain.append(float(_v(inc, ["rx_antenna_gain_dbi", "rx_gain_dbi"], default_rx_gain_dbi)))
+        az.append(float(_v(inc, ["rx_antenna_azimuth_deg", "rx_azimuth_deg", "az_deg"], 0.0)))
+        pol.append(_POL_CODES.get(str(_v(inc, ["polarization"], ""))[:1].upper(), POL_UNKNOWN))
+        rpe_az.append(inc.get("rx_rpe_az"))
+        rpe_el.append(inc.get("rx_rpe_el"))
+        link_id.append(str(_v(inc, ["link_id", "fs_id", "id"], "unknown")))
+    pol_arr = np.asarray(pol, dtype=np.uint8)
+    return IncumbentTable(
+        lat=np.asarray(lat, dtype=float),
+        lon=np.asarray(lon, dtype=float),
+        center_mhz=np.asarray(center, dtype=float),
+        bw_mhz=np.asarray(bw, dtype=float),
+        rx_gain_dbi=np.asarray(gain, dtype=float),
+        rx_az_deg=np.asarray(az, dtype=float),
+        pol=pol_arr,
+        # Placeholder 3 dB cross-pol discrimination for H/V receivers
+        pol_loss_db=np.where(pol_arr != POL_UNKNOWN, 3.0, 0.0),
+        has_rpe=np.asarray([bool(a and e) for a, e in zip(rpe_az, rpe_el)], dtype=bool),
+        rpe_az=rpe_az,
+        rpe_el=rpe_el,
+        link_id=link_id,
+    )
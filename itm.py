@@ -8,12 +8,16 @@ implementation will be straightforward.
 WINNF-TS-1014: 9.1.3 Propagation Models — binding location for ITM.
 """
 
+from functools import lru_cache
 from typing import Optional
 import math
 
 from .fspl import fspl_db
 
 
+# Channel sweeps re-evaluate the same geometry at each center frequency and
+# bandwidth; results are memoized on the exact arguments (bit-identical values).
+@lru_cache(maxsize=4096)
 def longley_rice_pathloss_db(
     distance_m: float,
     frequency_hz: float,
@@ -0,0 +1,127 @@
+"""Optional JIT-compiled numeric kernels (Numba).
+
+Numba is an optional dependency. When it is installed, the kernels below are
+compiled with `numba.njit` and callers can use them for the hottest loops;
+otherwise `HAVE_NUMBA` is False, the decorators are no-ops and callers keep
+their NumPy paths.
+
+Kernels mirror the scalar reference functions term for term (same operation
+order, no fastmath) so results agree with the NumPy/scalar paths.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+_FOUR_PI = 4.0 * math.pi
+_C = 2.99792458e8  # m/s
+
+
+@njit(cache=True)
+def _fspl_db(distance_m, frequency_hz):
+    return 20.0 * math.log10(_FOUR_PI * distance_m * frequency_hz / _C)
+
+
+@njit(cache=True)
+def _default_pathloss_db(distance_m, frequency_hz, winner_threshold_m):
+    # select_pathloss_db(selector=None) without the extra-loss offset:
+    # WINNER II-like below the threshold, ITM-like placeholder beyond
+    if distance_m < winner_threshold_m:
+        return _fspl_db(1.0, frequency_hz) + 10.0 * 2.1 * math.log10(max(distance_m, 1.0) / 1.0) + 0.0
+    return _fspl_db(distance_m, frequency_hz) + 10.0 * math.log10(max(distance_m, 1.0)) * 0.1
+
+
+@njit(cache=True)
+def _interp_flat(x, xp, fp):
+    # np.interp for one sorted mask: linear between points, flat beyond the ends
+    n = xp.shape[0]
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[n - 1]:
+        return fp[n - 1]
+    j = 1
+    while xp[j] < x:
+        j += 1
+    slope = (fp[j] - fp[j - 1]) / (xp[j] - xp[j - 1])
+    return slope * (x - xp[j - 1]) + fp[j - 1]
+
+
+@njit(parallel=True, cache=True)
+def freq_bin_min_eirp_kernel(
+    ch_lo, ch_hi, ch_center,
+    inc_distance_m, inc_center_mhz, inc_lo_mhz, inc_hi_mhz, inc_pol_loss_db,
+    extra_loss_db, winner_threshold_m,
+    i_thresh_dbm, g_rx_dbi, l_rx_db, max_eirp_dbm,
+    tx_x, tx_y, rx_x, rx_y,
+):
+    """Most restrictive allowed EIRP per 1 MHz bin across all incumbents.
+
+    Same math as the NumPy frequency sweep in protocol.handle_available_spectrum_inquiry:
+    co-channel EIRP is I_thresh + PL − G_rx + L_rx + L_pol capped at max EIRP;
+    non-overlapping pairs add ACIR (mask interpolation) on top of the capped value.
+    """
+    n_bins = ch_center.shape[0]
+    n_inc = inc_center_mhz.shape[0]
+    best = np.empty(n_bins)
+    for b in prange(n_bins):
+        f_hz = ch_center[b] * 1e6
+        best_b = max_eirp_dbm
+        for i in range(n_inc):
+            pl = _default_pathloss_db(inc_distance_m[i], f_hz, winner_threshold_m) + extra_loss_db
+            eirp = min(i_thresh_dbm + pl - g_rx_dbi + l_rx_db + inc_pol_loss_db[i], max_eirp_dbm)
+            overlaps = min(ch_hi[b], inc_hi_mhz[i]) - max(ch_lo[b], inc_lo_mhz[i])
+            if overlaps <= 0:
+                offset = abs(ch_center[b] - inc_center_mhz[i])
+                a_tx = _interp_flat(offset, tx_x, tx_y)
+                a_rx = _interp_flat(offset, rx_x, rx_y)
+                eirp = eirp + 10.0 * math.log10(1.0 / (10.0 ** (-a_tx / 10.0) + 10.0 ** (-a_rx / 10.0)))
+            if eirp < best_b:
+                best_b = eirp
+        best[b] = best_b
+    return best
+
+
+@njit(parallel=True, cache=True)
+def grant_min_eirp_kernel(
+    pl_db, adjacent, acir_db, site_pol_loss_db,
+    i_thresh_dbm, g_rx_dbi, l_rx_db, max_eirp_dbm,
+):
+    """Most restrictive allowed EIRP per channel over a (channels x sites) grid.
+
+    Same math and tie-breaking as the per-site loop in
+    grant_table.build_grant_table_with_incumbents: the capped co-channel EIRP,
+    plus ACIR where the pair is adjacent; the first site with a strictly lower
+    EIRP than the running minimum (starting at max EIRP) is limiting.
+    Returns (best_eirp_dbm, limiting_site) with limiting_site -1 when no site
+    is below max EIRP.
+    """
+    n_ch = pl_db.shape[0]
+    n_site = pl_db.shape[1]
+    best = np.empty(n_ch)
+    arg = np.empty(n_ch, dtype=np.int64)
+    for c in prange(n_ch):
+        best_c = max_eirp_dbm
+        arg_c = -1
+        for s in range(n_site):
+            eirp = min(i_thresh_dbm + pl_db[c, s] - g_rx_dbi + l_rx_db + site_pol_loss_db[s], max_eirp_dbm)
+            if adjacent[c, s]:
+                eirp = eirp + acir_db[c, s]
+            if eirp < best_c:
+                best_c = eirp
+                arg_c = s
+        best[c] = best_c
+        arg[c] = arg_c
+    return best, arg
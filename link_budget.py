@@ -10,10 +10,18 @@ Functions:
 - inr_db: compute I/N in dB.
 - i_threshold_dbm: compute allowed interference level given INR limit.
 - interference_margin_db: margin between threshold and computed interference.
+- db_to_lin / lin_to_db: vectorized dB <-> linear power conversions.
 """
 
 import math
 
+import numpy as np
+
+
+# 10**(x/10) == exp(x * ln(10)/10); np.exp/np.log are cheaper than np.power(10, .)
+_LN10_OVER_10 = math.log(10.0) / 10.0
+_TEN_OVER_LN10 = 10.0 / math.log(10.0)
+
 
 def compute_eirp_dbm(p_tx_dbm: float, g_tx_dbi: float, l_tx_losses_db: float) -> float:
     """Compute EIRP in dBm.
@@ -72,3 +80,12 @@ def interference_margin_db(i_dbm: float, i_thresh_dbm: float) -> float:
     """
     return i_thresh_dbm - i_dbm
 
+
+def db_to_lin(x_db):
+    """Linear power ratio (or mW from dBm) for array-like dB values: 10**(x/10)."""
+    return np.exp(np.asarray(x_db, dtype=np.float64) * _LN10_OVER_10)
+
+
+def lin_to_db(x_lin):
+    """dB (or dBm from mW) for array-like positive linear values: 10*log10(x)."""
+    return np.log(np.asarray(x_lin, dtype=np.float64)) * _TEN_OVER_LN10
@@ -19,7 +19,9 @@ from dataclasses import dataclass
 from typing import Iterable, Dict, Any, List, Tuple
 import math
 
-from .geodesy import haversine_distance_m, initial_bearing_deg
+import numpy as np
+
+from .geodesy import haversine_distance_matrix_m, initial_bearing_deg_vec
 from .propagation import select_pathloss_db
 from .itm import longley_rice_pathloss_db
 from .antenna import AntennaPatternParams, off_axis_azimuth_deg, effective_gain_dbi
@@ -61,10 +63,17 @@ def evaluate_aggregate_inr_for_channel(
     Returns a list of dicts: {link_id, inr_db, pass, components: [(ap_idx, i_dbm), ...]}
     """
     f_hz = center_mhz * 1e6
+    inc_list = list(incumbents)
+    ap_list = list(ap_sites)
+    ap_lats = np.array([ap.lat for ap in ap_list], dtype=float)
+    ap_lons = np.array([ap.lon for ap in ap_list], dtype=float)
+    inc_lats = np.array([float(inc.get("rx_lat", 0.0)) for inc in inc_list], dtype=float)
+    inc_lons = np.array([float(inc.get("rx_lon", 0.0)) for inc in inc_list], dtype=float)
+    # (AP x incumbent) geometry once per channel instead of per pair
+    d_all = haversine_distance_matrix_m(ap_lats, ap_lons, inc_lats, inc_lons).tolist()
+    brg_all = initial_bearing_deg_vec(ap_lats[:, None], ap_lons[:, None], inc_lats[None, :], inc_lons[None, :]).tolist()
     results: List[Dict[str, Any]] = []
-    for inc in incumbents:
-        rx_lat = float(inc.get("rx_lat", 0.0))
-        rx_lon = float(inc.get("rx_lon", 0.0))
+    for k, inc in enumerate(inc_list):
         rx_az = float(inc.get("rx_antenna_azimuth_deg", 0.0))
         rx_gain = float(inc.get("rx_antenna_gain_dbi", 30.0))
         rpe_az = inc.get("rx_rpe_az")
@@ -77,10 +86,10 @@ def evaluate_aggregate_inr_for_channel(
         n_dbm = noise_power_dbm(n_bw, nf_db=4.5)
 
         comps: List[Tuple[int, float]] = []
-        for idx, ap in enumerate(ap_sites):
-            d_m = haversine_distance_m(ap.lat, ap.lon, rx_lat, rx_lon)
+        for idx, ap in enumerate(ap_list):
+            d_m = d_all[idx][k]
             pl_db = _path_loss(d_m, f_hz, environment, path_model, float(rx_h_m) if rx_h_m else None)
-            brg = initial_bearing_deg(ap.lat, ap.lon, rx_lat, rx_lon)
+            brg = brg_all[idx][k]
             delta_az = off_axis_azimuth_deg(rx_az, (brg + 180.0) % 360.0)
             if rpe_az and rpe_el:
                 g_eff = combined_rpe_gain_dbi(rx_gain, delta_az, 0.0, rpe_az, rpe_el)
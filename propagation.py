@@ -9,9 +9,13 @@ WINNF-TS-1014 reference:
 """
 
 import math
+from functools import lru_cache
 from typing import Literal, Optional
 
-from .fspl import fspl_db
+import numpy as np
+
+from .fspl import fspl_db, fspl_db_vec
+from .itm import longley_rice_pathloss_db
 
 
 PathlossModel = Literal["fspl", "winner2", "itm"]
@@ -115,7 +119,22 @@ def select_pathloss_db(
     """Select a pathloss model by distance or explicit selector.
 
     Default: WINNER II-like for d < winner_threshold_m, ITM-like for longer.
+    Results are memoized on the exact arguments (see `_select_pathloss_cached`).
     """
+    return _select_pathloss_cached(
+        distance_m, frequency_hz, selector, winner_threshold_m, environment, indoor, penetration_db
+    )
+
+
+def _select_pathloss_impl(
+    distance_m: float,
+    frequency_hz: float,
+    selector: PathlossModel | None,
+    winner_threshold_m: float,
+    environment: Environment | None,
+    indoor: bool,
+    penetration_db: Optional[float],
+) -> float:
     if selector == "fspl":
         pl = fspl_db(distance_m, frequency_hz)
     elif selector == "winner2" or (selector is None and distance_m < winner_threshold_m):
@@ -125,9 +144,69 @@ def select_pathloss_db(
     else:
         raise ValueError("Unknown pathloss selector")
 
-    if environment is not None:
-        pl += environment_extra_loss_db(environment)
-    # Add optional building penetration loss (e.g., indoor FS or AP)
-    pl += building_penetration_loss_db(indoor=indoor, penetration_db=penetration_db)
+    return pl + extra_loss_db(environment, indoor, penetration_db)
+
+
+def extra_loss_db(environment: Environment | None, indoor: bool = False, penetration_db: Optional[float] = None) -> float:
+    """Environment preset plus optional building penetration loss (dB).
+
+    This is the offset select_pathloss_db adds to the model loss, folded into
+    one value so callers (e.g. compiled kernels) can apply a single add.
+    """
+    env_db = environment_extra_loss_db(environment) if environment is not None else 0.0
+    return env_db + building_penetration_loss_db(indoor=indoor, penetration_db=penetration_db)
+
+
+def select_pathloss_db_vec(
+    distance_m,
+    frequency_hz,
+    selector: PathlossModel | None = None,
+    winner_threshold_m: float = 5000.0,
+    environment: Environment | None = None,
+    indoor: bool = False,
+    penetration_db: Optional[float] = None,
+) -> np.ndarray:
+    """Vectorized select_pathloss_db over NumPy-broadcastable distance/frequency.
+
+    Mirrors the scalar models term for term; with the default selector the
+    WINNER II / ITM choice is made per element by distance.
+    """
+    d = np.asarray(distance_m, dtype=float)
+    f = np.asarray(frequency_hz, dtype=float)
+    if selector not in (None, "fspl", "winner2", "itm"):
+        raise ValueError("Unknown pathloss selector")
+    if np.any(d <= 0) or np.any(f <= 0):
+        raise ValueError("distance and frequency must be positive")
+    if selector == "fspl":
+        pl = fspl_db_vec(d, f)
+    elif selector == "winner2":
+        pl = _winner2_default_vec(d, f)
+    elif selector == "itm":
+        pl = _itm_default_vec(d, f)
+    else:
+        pl = np.where(d < winner_threshold_m, _winner2_default_vec(d, f), _itm_default_vec(d, f))
+    pl = np.asarray(pl, dtype=float)  # fresh ufunc output: add the offset in place
+    pl += extra_loss_db(environment, indoor, penetration_db)
     return pl
 
+
+def _winner2_default_vec(d: np.ndarray, f: np.ndarray) -> np.ndarray:
+    # winner2_pathloss_db with its defaults (n=2.1, d0=1 m, no additional loss)
+    return fspl_db_vec(1.0, f) + 10.0 * 2.1 * np.log10(np.maximum(d, 1.0) / 1.0) + 0.0
+
+
+def _itm_default_vec(d: np.ndarray, f: np.ndarray) -> np.ndarray:
+    # itm_pathloss_db without terrain: FSPL plus 0.1 dB per decade of distance
+    return fspl_db_vec(d, f) + 10.0 * np.log10(np.maximum(d, 1.0)) * 0.1
+
+
+# Inquiry loops re-evaluate the same (distance, frequency) pairs across bins,
+# channels and repeated requests. Keys are the exact inputs, so cached values
+# are bit-identical to a direct evaluation.
+_select_pathloss_cached = lru_cache(maxsize=1 << 16)(_select_pathloss_impl)
+
+
+def clear_pathloss_caches() -> None:
+    """Drop memoized path-loss values (select_pathloss_db and the ITM placeholder)."""
+    _select_pathloss_cached.cache_clear()
+    longley_rice_pathloss_db.cache_clear()
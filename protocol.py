@@ -14,25 +14,34 @@ standard response codes. Supported query modes:
 
 Also supports optional overrides via keywords (environment, path_model,
 protection_margin_db) that are threaded into the request for convenience.
+Pass return_json_bytes=True to get the encoded JSON body (orjson when
+installed, stdlib json otherwise).
 """
 
 from __future__ import annotations
 
+import json
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
+
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from .spec_params import SpecParameters
-from .spectrum_inquiry import spectrum_inquiry
-from .grant_table import build_grant_table_with_incumbents
+from .grant_table import build_grant_table_with_incumbents, evaluate_channels_batch
 from .link_budget import noise_power_dbm
-from .propagation import select_pathloss_db
-from .geodesy import haversine_distance_m, initial_bearing_deg
-from .antenna import AntennaPatternParams, off_axis_azimuth_deg, effective_gain_dbi
-from .antenna_rpe import combined_rpe_gain_dbi
-from .acir_defaults import ensure_defaults
-from .acir_masks import acir_db_from_masks
-from .allocator import allowed_eirp_dbm_with_spec
+from .propagation import extra_loss_db, select_pathloss_db_vec
+from .kernels import HAVE_NUMBA, freq_bin_min_eirp_kernel
+from .geodesy import haversine_distance_m_vec
+from .incumbent_table import normalize_incumbents
+from .acir_masks import acir_db_from_masks_vec
 
 
 # Response codes per TS-3007 §6.2/6.3
@@ -43,12 +52,47 @@ RC_INVALID_VALUE = 103
 RC_UNEXPECTED_PARAM = 106
 RC_UNSUPPORTED_BASIS = 301
 
+# §6.2 horizontal uncertainty fields; at most one may be present
+_HORIZ_FIELDS = ("ellipse", "linearPolygon", "radialPolygon")
+# Minimal placeholder mapping; may not include Wi‑Fi Operating Classes like 134
+_GOC_TO_BW = {300: 20.0, 301: 40.0, 302: 60.0, 303: 80.0, 304: 100.0}
+
+
+# (monotonic time, seconds, expiry string) of the last clock-based expiry
+_LAST_EXPIRY: Tuple[float, int, str] = (float("-inf"), 0, "")
+_EXPIRY_REUSE_S = 0.05
+# UTC, whole seconds (TS-3007 needs no sub-second expiry)
+_EXPIRY_FMT = "%Y-%m-%dT%H:%M:%SZ"
 
-def _expiry_iso8601(seconds: int = 900) -> str:
-    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat()
+
+def _expiry_iso8601(seconds: int = 900, now: datetime | None = None) -> str:
+    # Responses issued within _EXPIRY_REUSE_S of each other share one expiry string;
+    # pass `now` to stamp a batch of responses from one explicit instant instead (naive = UTC)
+    global _LAST_EXPIRY
+    if now is not None:
+        if now.tzinfo is not None:
+            now = now.astimezone(timezone.utc)
+        return (now + timedelta(seconds=seconds)).strftime(_EXPIRY_FMT)
+    t = time.monotonic()
+    last_t, last_seconds, last_iso = _LAST_EXPIRY
+    if last_seconds == seconds and t - last_t < _EXPIRY_REUSE_S:
+        return last_iso
+    iso = time.strftime(_EXPIRY_FMT, time.gmtime(time.time() + seconds))
+    _LAST_EXPIRY = (t, seconds, iso)
+    return iso
+
+
+def encode_response_json(response: Dict[str, Any]) -> bytes:
+    # orjson when available (C speed, handles NumPy scalars); stdlib json otherwise
+    if orjson is not None:
+        return orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(response, separators=(",", ":")).encode("utf-8")
 
 
 def _is_number(x: Any) -> bool:
+    # Fast path for JSON numbers; bools fall through so float(True) keeps its old meaning
+    if isinstance(x, (int, float)) and not isinstance(x, bool):
+        return True
     try:
         float(x)
         return True
@@ -57,16 +101,50 @@ def _is_number(x: Any) -> bool:
 
 
 def nru_goc_to_bw_mhz(goc: int) -> float | None:
-    # Minimal placeholder mapping; may not include Wi‑Fi Operating Classes like 134
-    mapping = {300: 20.0, 301: 40.0, 302: 60.0, 303: 80.0, 304: 100.0}
-    return mapping.get(goc)
+    return _GOC_TO_BW.get(goc)
 
 
+@lru_cache(maxsize=4096)
 def nru_cfi_to_center_mhz(cfi: int) -> float:
     # Annex A: Fc (MHz) = 3000 + 15 * (CFI - 600000) / 1000
     return 3000.0 + 15.0 * (float(cfi) - 600000.0) / 1000.0
 
 
+def nru_cfi_to_center_mhz_vec(cfis: Iterable[int]) -> np.ndarray:
+    # Same Annex A formula over an array of CFIs; kept in the scalar's operation
+    # order (multiply, then divide) so both variants agree bit for bit
+    cfi_arr = np.asarray(cfis, dtype=np.float64)
+    return 3000.0 + 15.0 * (cfi_arr - 600000.0) / 1000.0
+
+
+def _coalesce_psd_runs(lo_arr: np.ndarray, hi_arr: np.ndarray, psd_arr: np.ndarray, tol: float):
+    # Run-length encode contiguous bins: a new run starts at the first bin whose PSD differs
+    # from the run's first bin by >= tol (so slow drift cannot stretch a run), and each run
+    # reports its first bin's PSD over its first bin's low edge to its last bin's high edge
+    n = psd_arr.size
+    if n == 0:
+        return lo_arr, hi_arr, psd_arr
+    # Fast path: neighbour steps >= tol split the bins into segments. These are exactly the
+    # runs when each segment spans less than tol and each segment start is >= tol away from
+    # the previous segment's start (always so when every step is >= tol or exactly 0)
+    starts_arr = np.concatenate(([0], np.flatnonzero(np.abs(np.diff(psd_arr)) >= tol) + 1)).astype(np.intp)
+    if not (
+        np.all(np.maximum.reduceat(psd_arr, starts_arr) - np.minimum.reduceat(psd_arr, starts_arr) < tol)
+        and np.all(np.abs(np.diff(psd_arr[starts_arr])) >= tol)
+    ):
+        # Drift below tol per step (or NaN): one pass against the current run's start
+        vals = psd_arr.tolist()
+        starts: List[int] = [0]
+        run_psd = vals[0]
+        for i, p in enumerate(vals):
+            if abs(p - run_psd) >= tol:
+                starts.append(i)
+                run_psd = p
+        starts_arr = np.asarray(starts, dtype=np.intp)
+    ends = np.append(starts_arr[1:], n) - 1
+    return lo_arr[starts_arr], hi_arr[ends], psd_arr[starts_arr]
+
+
 def handle_available_spectrum_inquiry(
     request: Dict[str, Any],
     spec: SpecParameters,
@@ -82,7 +160,25 @@ def handle_available_spectrum_inquiry(
     disallowed_pairs: Iterable[Tuple[str, str]] | None = None,
     # Back-compat: allow a params_text_path kw (ignored here; parser happens outside)
     params_text_path: str | None = None,
-) -> Dict[str, Any]:
+    # Return the encoded JSON body (see encode_response_json) instead of a dict
+    return_json_bytes: bool = False,
+    # Shared clock for availabilityExpireTime (e.g. one instant per batch of requests)
+    now: datetime | None = None,
+) -> Dict[str, Any] | bytes:
+    if return_json_bytes:
+        return encode_response_json(handle_available_spectrum_inquiry(
+            request,
+            spec,
+            incumbents,
+            environment=environment,
+            path_model=path_model,
+            protection_margin_db=protection_margin_db,
+            certified_ids=certified_ids,
+            disallowed_ids=disallowed_ids,
+            disallowed_pairs=disallowed_pairs,
+            params_text_path=params_text_path,
+            now=now,
+        ))
     # Thread optional overrides into the request for consistent downstream use
     if environment is not None:
         request["environment"] = environment
@@ -90,6 +186,12 @@ def handle_available_spectrum_inquiry(
         request["pathModel"] = path_model
     if protection_margin_db is not None:
         request["protectionMarginDb"] = float(protection_margin_db)
+    # Per-request invariants: materialize the incumbents once and hash the
+    # certification filters once (None keeps "no enforcement")
+    incumbents = list(incumbents)
+    certified_set = frozenset(certified_ids) if certified_ids is not None else None
+    disallowed_set = frozenset(disallowed_ids) if disallowed_ids is not None else None
+    disallowed_pair_set = frozenset(disallowed_pairs) if disallowed_pairs is not None else None
     # Basic validation: location
     missing: List[str] = []
     # Accept either top-level {"location":{...}} or {"device":{"location":{...}}}
@@ -105,7 +207,7 @@ def handle_available_spectrum_inquiry(
         if not _is_number(loc.get("lon")):
             missing.append("location.lon")
         # §6.2 unexpected if multiple horizontal uncertainty fields present; reject if more than one given
-        horiz_fields = [f for f in ("ellipse", "linearPolygon", "radialPolygon") if f in loc]
+        horiz_fields = [f for f in _HORIZ_FIELDS if f in loc]
         if len(horiz_fields) > 1:
             return {"responseCode": RC_UNEXPECTED_PARAM, "supplementalInfo": {"unexpectedParams": horiz_fields}}
     if missing:
@@ -120,14 +222,14 @@ def handle_available_spectrum_inquiry(
     cert = request.get("certification", {}) if isinstance(request.get("certification"), dict) else {}
     cert_id = cert.get("id")
     serial = cert.get("serialNumber")
-    if certified_ids is not None and cert_id is not None:
-        if cert_id not in set(certified_ids):
+    if certified_set is not None and cert_id is not None:
+        if cert_id not in certified_set:
             return {"responseCode": RC_INVALID_VALUE, "supplementalInfo": {"invalidParams": ["certification.id"]}}
-    if disallowed_ids is not None and cert_id is not None:
-        if cert_id in set(disallowed_ids):
+    if disallowed_set is not None and cert_id is not None:
+        if cert_id in disallowed_set:
             return {"responseCode": RC_DEVICE_DISALLOWED}
-    if disallowed_pairs is not None and cert_id is not None and serial is not None:
-        if (cert_id, str(serial)) in set(disallowed_pairs):
+    if disallowed_pair_set is not None and cert_id is not None and serial is not None:
+        if (cert_id, str(serial)) in disallowed_pair_set:
             return {"responseCode": RC_DEVICE_DISALLOWED}
 
     # Decide which method is requested
@@ -154,6 +256,32 @@ def handle_available_spectrum_inquiry(
         model = request.get("pathModel", "auto")
         margin = float(request.get("protectionMarginDb", 0.0))
         results = []  # list of AvailableFrequencyInfo {frequencyRange:{low,high}, maxPsd}
+
+        # Per-incumbent fields as parallel arrays (structure of arrays); everything here
+        # is frequency independent, so it is gathered once per request
+        table = normalize_incumbents(incumbents, spec.incumbent.antenna_gain_dbi)
+        # Only AP→FS distances enter the allowed EIRP: the FS gain is the spec's boresight
+        # gain (no off-axis discrimination), so no per-incumbent gains are computed
+        distances_m = haversine_distance_m_vec(ap_lat, ap_lon, table.lat, table.lon)
+        fs_center_arr = table.center_mhz
+        fs_lo_arr = fs_center_arr - table.bw_mhz / 2.0
+        fs_hi_arr = fs_center_arr + table.bw_mhz / 2.0
+        pol_loss_arr = table.pol_loss_db
+
+        # FS noise and the ACIR masks (sorted once by ACIRSpec) depend only on the spec
+        n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
+        max_eirp = spec.wifi_limits.max_eirp_dbm
+        i_thr = n_dbm + (-6.0 - margin)
+        merge_bins = bool(request.get("mergeBins", True))
+        tol = float(request.get("mergeToleranceDb", 1e-6))
+        if HAVE_NUMBA:
+            # Compiled kernel inputs; the kernel skips the selector's input checks
+            if np.any(distances_m <= 0):
+                raise ValueError("distance and frequency must be positive")
+            extra_db = extra_loss_db(env)
+            tx_x, tx_y = spec.acir.tx_offsets_mhz, spec.acir.tx_atten_db
+            rx_x, rx_y = spec.acir.rx_offsets_mhz, spec.acir.rx_atten_db
+
         for fr in freq_req:
             try:
                 if "lowMHz" in fr and "highMHz" in fr:
@@ -171,114 +299,49 @@ def handle_available_spectrum_inquiry(
             # 1 MHz bins, compute directly at center f+0.5 to avoid Wi‑Fi grid alignment
             start_mhz = int(lo)
             end_mhz = int(hi)
-            bins = []  # (low, high, psd)
-            a_tx_def, a_rx_def = ensure_defaults(spec.acir.a_tx_db_by_offset_mhz, spec.acir.a_rx_db_by_offset_mhz)
-            tx_points = sorted((float(k), float(v)) for k, v in a_tx_def.items())
-            rx_points = sorted((float(k), float(v)) for k, v in a_rx_def.items())
-
-            def _v(d: dict, keys: list[str], default=None):
-                for k in keys:
-                    if k in d and d[k] is not None:
-                        return d[k]
-                return default
-
-            for f in range(start_mhz, end_mhz):
-                center = f + 0.5
-                ch_lo = float(f)
-                ch_hi = float(f + 1)
-                f_hz = center * 1e6
-                # FS noise from spec defaults
-                n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
-
-                best_eirp = spec.wifi_limits.max_eirp_dbm
-                for inc in incumbents:
-                    fs_center_mhz = float(_v(inc, ["freq_center_mhz", "center_mhz", "fs_center_mhz"]))
-                    fs_bw_mhz = float(_v(inc, ["bandwidth_mhz", "fs_bandwidth_mhz", "rx_bw_mhz"]))
-                    rx_lat = float(_v(inc, ["rx_lat", "lat"], 0.0))
-                    rx_lon = float(_v(inc, ["rx_lon", "lon"], 0.0))
-                    fs_rx_gain = float(_v(inc, ["rx_antenna_gain_dbi", "rx_gain_dbi"],  spec.incumbent.antenna_gain_dbi))
-                    rx_az = float(_v(inc, ["rx_antenna_azimuth_deg", "rx_azimuth_deg", "az_deg"], 0.0))
-                    pol = str(_v(inc, ["polarization"], ""))[:1].upper()
-                    rpe_az = inc.get("rx_rpe_az")
-                    rpe_el = inc.get("rx_rpe_el")
-                    rx_h_m = _v(inc, ["rx_antenna_height_m", "rx_height_m", "height_m"])  # may be None
-
-                    # Geometry and path loss
-                    d_m = haversine_distance_m(ap_lat, ap_lon, rx_lat, rx_lon)
-                    brg = initial_bearing_deg(ap_lat, ap_lon, rx_lat, rx_lon)
-                    pl_db = select_pathloss_db(distance_m=d_m, frequency_hz=f_hz, environment=env)
-
-                    # Antenna discrimination (azimuth only)
-                    delta_az = off_axis_azimuth_deg(rx_az, (brg + 180.0) % 360.0)
-                    if rpe_az and rpe_el:
-                        g_eff = combined_rpe_gain_dbi(fs_rx_gain, delta_az, 0.0, rpe_az, rpe_el)
-                    else:
-                        g_eff = effective_gain_dbi(AntennaPatternParams(g_max_dbi=fs_rx_gain), delta_az, 0.0)
-
-                    # Overlap vs adjacent
-                    fs_lo = fs_center_mhz - fs_bw_mhz / 2.0
-                    fs_hi = fs_center_mhz + fs_bw_mhz / 2.0
-                    overlaps = min(ch_hi, fs_hi) - max(ch_lo, fs_lo)
-                    if overlaps > 0:
-                        eirp = allowed_eirp_dbm_with_spec(
-                            n_dbm=n_dbm,
-                            inr_limit_db=-6.0 - margin,
-                            path_loss_db=pl_db,
-                            spec=spec,
-                            channel_offset_mhz=None,
-                            eirp_regulatory_max_dbm=None,
-                            l_polarization_db=(3.0 if pol in ("H","V") else 0.0),
-                        )
-                    else:
-                        offset = abs(center - fs_center_mhz)
-                        acir_val = acir_db_from_masks(offset, tx_points, rx_points)
-                        eirp = allowed_eirp_dbm_with_spec(
-                            n_dbm=n_dbm,
-                            inr_limit_db=-6.0 - margin,
-                            path_loss_db=pl_db,
-                            spec=spec,
-                            channel_offset_mhz=None,
-                            eirp_regulatory_max_dbm=None,
-                            l_polarization_db=(3.0 if pol in ("H","V") else 0.0),
-                        ) + acir_val
-                    if eirp < best_eirp:
-                        best_eirp = eirp
-
-                # For 1 MHz bins, PSD == EIRP numerically
-                bins.append((float(f), float(f + 1), float(best_eirp)))
+            # Bins × incumbents grid: rows are 1 MHz bins, columns incumbents
+            lo_arr = np.arange(start_mhz, end_mhz, dtype=float)
+            hi_arr = lo_arr + 1.0
+            center_arr = lo_arr + 0.5
+            if HAVE_NUMBA:
+                psd_arr = freq_bin_min_eirp_kernel(
+                    lo_arr, hi_arr, center_arr,
+                    distances_m, fs_center_arr, fs_lo_arr, fs_hi_arr, pol_loss_arr,
+                    extra_db, 5000.0,
+                    i_thr, spec.incumbent.antenna_gain_dbi, spec.incumbent.rx_losses_db, max_eirp,
+                    tx_x, tx_y, rx_x, rx_y,
+                )
+            else:
+                pl_db = select_pathloss_db_vec(distances_m[None, :], center_arr[:, None] * 1e6, environment=env)
+
+                # allowed_eirp_dbm_with_spec inlined: I_thresh + PL − G_rx + L_rx + L_pol, capped
+                eirp = np.minimum(
+                    i_thr + pl_db - spec.incumbent.antenna_gain_dbi + spec.incumbent.rx_losses_db + pol_loss_arr[None, :],
+                    max_eirp,
+                )
+                # Overlap vs adjacent: non-overlapping pairs get ACIR on top of the capped value.
+                # ACIR is evaluated over the whole grid and selected with a mask (no gather/scatter)
+                overlaps = np.minimum(hi_arr[:, None], fs_hi_arr[None, :]) - np.maximum(lo_arr[:, None], fs_lo_arr[None, :])
+                acir_vals = acir_db_from_masks_vec(np.abs(center_arr[:, None] - fs_center_arr[None, :]), spec.acir.tx_points, spec.acir.rx_points)
+                eirp = np.where(overlaps > 0, eirp, eirp + acir_vals)
+
+                psd_arr = np.min(eirp, axis=1, initial=max_eirp)
+            # For 1 MHz bins, PSD == EIRP numerically
             # Merge adjacent bins with same PSD (within tol), unless disabled
-            merge_bins = bool(request.get("mergeBins", True))
-            tol = float(request.get("mergeToleranceDb", 1e-6))
             if merge_bins:
-                merged: List[Tuple[float, float, float]] = []
-                for b in bins:
-                    if not merged:
-                        merged.append(list(b))  # type: ignore[list-item]
-                    else:
-                        last = merged[-1]
-                        if abs(last[2] - b[2]) < tol and abs(last[1] - b[0]) < 1e-9:
-                            merged[-1] = (last[0], b[1], last[2])
-                        else:
-                            merged.append(b)
-                for lo_b, hi_b, psd in merged:
-                    results.append({
-                        "frequencyRange": {"lowMHz": lo_b, "highMHz": hi_b},
-                        "maxPsd": psd,
-                    })
-            else:
-                for lo_b, hi_b, psd in bins:
-                    results.append({
-                        "frequencyRange": {"lowMHz": lo_b, "highMHz": hi_b},
-                        "maxPsd": psd,
-                    })
-        return {"responseCode": RC_SUCCESS, "availabilityExpireTime": _expiry_iso8601(), "availableFrequencyInfo": results}
+                lo_arr, hi_arr, psd_arr = _coalesce_psd_runs(lo_arr, hi_arr, psd_arr, tol)
+            results.extend(
+                {"frequencyRange": {"lowMHz": lo_b, "highMHz": hi_b}, "maxPsd": psd}
+                for lo_b, hi_b, psd in zip(lo_arr.tolist(), hi_arr.tolist(), psd_arr.tolist())
+            )
+        return {"responseCode": RC_SUCCESS, "availabilityExpireTime": _expiry_iso8601(now=now), "availableFrequencyInfo": results}
 
     # Channel-based query
     if not isinstance(chan_req, list) or not chan_req:
         return {"responseCode": RC_MISSING_PARAM, "supplementalInfo": {"missingParams": ["inquiredChannels"]}}
 
     # Each entry should normally have a globalOperatingClass; if not mappable, we accept bandwidthMHz as fallback
-    centers: List[Tuple[float, float]] = []  # (center_mhz, bw_mhz)
+    parsed: List[Tuple[Any, float, List[int]]] = []  # (goc, bw, cfis)
     invalid: List[str] = []
     for item in chan_req:
         if not isinstance(item, dict):
@@ -306,66 +369,56 @@ def handle_available_spectrum_inquiry(
             bw = float(request["bandwidthMHz"])
         if bw is None:
             bw = 20.0
-        for cfi in cfis:
-            centers.append((nru_cfi_to_center_mhz(cfi), bw))
+        parsed.append((goc, bw, cfis))
 
     if invalid:
         return {"responseCode": RC_INVALID_VALUE, "supplementalInfo": {"invalidParams": list(set(invalid))}}
 
-    # Evaluate via spectrum inquiry across tiny per-channel bands
-    band_ranges = [(fc - bw / 2.0, fc + bw / 2.0) for fc, bw in centers]
-    rows = spectrum_inquiry(
+    # CFI -> center frequency for every inquired channel in one array expression,
+    # then split back per item
+    all_centers = nru_cfi_to_center_mhz_vec([c for _, _, cfis in parsed for c in cfis]).tolist()
+    centers: List[Tuple[float, float]] = []  # (center_mhz, bw_mhz)
+    item_centers_list: List[List[float]] = []
+    pos = 0
+    for _, bw, cfis in parsed:
+        item_centers = all_centers[pos:pos + len(cfis)]
+        pos += len(cfis)
+        item_centers_list.append(item_centers)
+        centers.extend((fc, bw) for fc in item_centers)
+
+    # Evaluate every distinct inquired channel in one batched (channels x incumbents)
+    # pass; channels repeated across (or within) items are evaluated once.
+    keys: List[Tuple[float, float]] = []
+    unique: List[Tuple[float, float]] = []
+    seen: set[Tuple[float, float]] = set()
+    for fc, bw in centers:
+        key = (round(fc, 6), bw)
+        if key in seen:
+            continue
+        seen.add(key)
+        keys.append(key)
+        unique.append((fc, bw))
+    batch_eirp = evaluate_channels_batch(
         spec=spec,
-        incumbents=list(incumbents),
+        incumbents=incumbents,
         ap_lat=ap_lat,
         ap_lon=ap_lon,
-        band_ranges_mhz=band_ranges,
-        bandwidths_mhz=tuple(sorted({bw for _, bw in centers})),
+        centers_mhz=[fc for fc, _ in unique],
+        bandwidths_mhz=[bw for _, bw in unique],
         inr_limit_db=-6.0,
         environment=request.get("environment", "urban"),
         path_model=request.get("pathModel", "auto"),
         protection_margin_db=float(request.get("protectionMarginDb", 0.0)),
-    )
+    ).tolist()
+    eirp_by_channel: Dict[Tuple[float, float], float] = dict(zip(keys, batch_eirp))
 
     # Build AvailableChannelInfo with parallel arrays channelCfi/maxEirp as per §6.3.4
     # We preserve the order of CFIs per item. Bandwidth is resolved per-item using
     # globalOperatingClass, item.bandwidthMHz, request.bandwidthMHz, then default 20 MHz.
 
     available = []
-    for item in chan_req:
-        goc = item.get("globalOperatingClass", item.get("goc"))
-        cfis = item.get("channelCfi", item.get("cfi", []))
-        # Resolve bandwidth per item
-        bw = None
-        if isinstance(goc, int):
-            bw = nru_goc_to_bw_mhz(goc)
-        if bw is None and isinstance(item.get("bandwidthMHz"), (int, float)):
-            bw = float(item["bandwidthMHz"])
-        if bw is None and isinstance(request.get("bandwidthMHz"), (int, float)):
-            bw = float(request["bandwidthMHz"])
-        if bw is None:
-            bw = 20.0
-        max_eirp_list: List[float] = []
-        for cfi in cfis:
-            fc = nru_cfi_to_center_mhz(cfi)
-            # Re-evaluate for this (fc,bw) to avoid dictionary key mismatch issues
-            sub_rows = spectrum_inquiry(
-                spec=spec,
-                incumbents=list(incumbents),
-                ap_lat=ap_lat,
-                ap_lon=ap_lon,
-                band_ranges_mhz=[(fc - bw / 2.0, fc + bw / 2.0)],
-                bandwidths_mhz=(bw,),
-                inr_limit_db=-6.0,
-                environment=request.get("environment", "urban"),
-                path_model=request.get("pathModel", "auto"),
-                protection_margin_db=float(request.get("protectionMarginDb", 0.0)),
-            )
-            if sub_rows:
-                eirp = sub_rows[0].allowed_eirp_dbm
-            else:
-                eirp = 0.0
-            max_eirp_list.append(eirp)
+    for (goc, bw, cfis), item_centers in zip(parsed, item_centers_list):
+        max_eirp_list = [eirp_by_channel.get((round(fc, 6), bw), 0.0) for fc in item_centers]
         entry = {
             "channelCfi": cfis,
             "maxEirp": max_eirp_list,
@@ -376,6 +429,6 @@ def handle_available_spectrum_inquiry(
             entry["bandwidthMHz"] = bw
         available.append(entry)
 
-    return {"responseCode": RC_SUCCESS, "availabilityExpireTime": _expiry_iso8601(), "availableChannelInfo": available}
+    return {"responseCode": RC_SUCCESS, "availabilityExpireTime": _expiry_iso8601(now=now), "availableChannelInfo": available}
 
 
@@ -7,12 +7,15 @@ angle_deg,attenuation_db
 ... etc.
 """
 
+import io
 from pathlib import Path
 from typing import Iterable, List, Tuple
 
+import numpy as np
 
-def load_rpe_csv(path: str | Path) -> List[Tuple[float, float]]:
-    text = Path(path).read_text(encoding="utf-8", errors="ignore")
+
+def _parse_rpe_lines(text: str) -> List[Tuple[float, float]]:
+    # Line-by-line parser: skips blanks, comments, headers and malformed rows
     pts: List[Tuple[float, float]] = []
     for line in text.splitlines():
         s = line.strip()
@@ -28,10 +31,45 @@ def load_rpe_csv(path: str | Path) -> List[Tuple[float, float]]:
             pts.append((ang, att))
         except Exception:
             continue
-    pts.sort(key=lambda x: x[0])
     return pts
 
 
+def _leading_non_data_rows(lines: List[str]) -> int:
+    # Number of lines before the first row whose first field is numeric (header, blanks, comments)
+    for idx, line in enumerate(lines):
+        try:
+            float(line.split(",", 1)[0])
+            return idx
+        except ValueError:
+            continue
+    return len(lines)
+
+
+def load_rpe_csv_np(path: str | Path) -> np.ndarray:
+    """Load an RPE CSV as an (N, 2) float array [angle_deg, attenuation_db] sorted by angle.
+
+    Uses NumPy's C parser; files it cannot take (stray text, short rows or
+    comment lines after the header) fall back to the line-by-line parser. As
+    there, only whole-line "#" comments are skipped: a row with a trailing
+    comment does not parse as a number and is dropped.
+    """
+    raw = Path(path).read_text(encoding="utf-8", errors="ignore").replace(";", ",")
+    lines = raw.splitlines()
+    skip = _leading_non_data_rows(lines)
+    if skip == len(lines):
+        return np.empty((0, 2))
+    try:
+        # comments=None: loadtxt would strip inline "# ..." and keep such rows
+        arr = np.loadtxt(io.StringIO(raw), delimiter=",", comments=None, usecols=(0, 1), ndmin=2, skiprows=skip)
+    except ValueError:
+        arr = np.array(_parse_rpe_lines(raw), dtype=float).reshape(-1, 2)
+    return arr[np.argsort(arr[:, 0], kind="stable")]
+
+
+def load_rpe_csv(path: str | Path) -> List[Tuple[float, float]]:
+    return [(ang, att) for ang, att in load_rpe_csv_np(path).tolist()]
+
+
 def rpe_from_list(values: Iterable[Tuple[float, float]]) -> List[Tuple[float, float]]:
     pts = [(float(a), float(d)) for a, d in values]
     pts.sort(key=lambda x: x[0])
@@ -11,15 +11,18 @@ format to include GIS, antenna patterns, and terrain later.
 """
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, List, Optional
 
+import numpy as np
+
 from .spec_params import SpecParameters
-from .propagation import select_pathloss_db
+from .propagation import select_pathloss_db_vec
 from .link_budget import noise_power_dbm
-from .allocator import allowed_eirp_dbm_with_spec
+from .acir import acir_db_from_spec
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
 	"""Minimal scenario definition.
 
@@ -36,7 +39,7 @@ class Scenario:
 	inr_limit_db: float = -6.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultRow:
 	"""One row of results for a distance/offset pair."""
 	distance_m: float
@@ -46,6 +49,27 @@ class ResultRow:
 	allowed_eirp_dbm: float
 
 
+def _scenario_grid(spec: SpecParameters, scenario: Scenario):
+	# Evaluated as a (distance × offset) grid: path loss per distance, then the
+	# allowed_eirp_dbm_with_spec formula broadcast over the ACIR-shifted thresholds
+	distances = list(scenario.distances_m)
+	offsets = list(scenario.channel_offsets_mhz)
+	pl_db = select_pathloss_db_vec(np.asarray(distances, dtype=float), scenario.frequency_hz)
+	n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
+	i_thr = n_dbm + scenario.inr_limit_db
+	# ACIR only for positive offsets (0 is co-channel), once per offset
+	eff_thr = np.array([
+		i_thr + acir_db_from_spec(spec.acir, off) if off > 0 else i_thr
+		for off in offsets
+	], dtype=float)
+	eirp = np.minimum(
+		eff_thr[None, :] + pl_db[:, None] - spec.incumbent.antenna_gain_dbi
+		+ spec.incumbent.rx_losses_db + spec.incumbent.polarization_mismatch_db,
+		spec.wifi_limits.max_eirp_dbm,
+	)
+	return distances, offsets, pl_db, n_dbm, eirp
+
+
 def run_scenario(spec: SpecParameters, scenario: Scenario) -> List[ResultRow]:
 	"""Compute allowed EIRP for each distance and channel offset.
 
@@ -57,31 +81,60 @@ def run_scenario(spec: SpecParameters, scenario: Scenario) -> List[ResultRow]:
 	3) Compute allowed EIRP using I/N <= -6 dB (or scenario.inr_limit_db) and
 	   ACIR if offset > 0.
 	"""
-	rows: List[ResultRow] = []
-	for d_m in scenario.distances_m:
-		pl_db = select_pathloss_db(distance_m=d_m, frequency_hz=scenario.frequency_hz)
-		n_dbm = noise_power_dbm(spec.incumbent.bandwidth_hz, spec.incumbent.noise_figure_db)
-		for off in scenario.channel_offsets_mhz:
-			eirp = allowed_eirp_dbm_with_spec(
-				n_dbm=n_dbm,
-				inr_limit_db=scenario.inr_limit_db,
-				path_loss_db=pl_db,
-				spec=spec,
-				channel_offset_mhz=(None if off == 0 else off),
-			)
-			rows.append(ResultRow(
-				distance_m=d_m,
-				channel_offset_mhz=off,
-				path_loss_db=pl_db,
-				noise_dbm=n_dbm,
-				allowed_eirp_dbm=eirp,
-			))
-	return rows
+	distances, offsets, pl_db, n_dbm, eirp = _scenario_grid(spec, scenario)
+	pl_list = pl_db.tolist()
+	eirp_rows = eirp.tolist()
+	return [
+		ResultRow(
+			distance_m=d_m,
+			channel_offset_mhz=off,
+			path_loss_db=pl_list[i],
+			noise_dbm=n_dbm,
+			allowed_eirp_dbm=eirp_rows[i][j],
+		)
+		for i, d_m in enumerate(distances)
+		for j, off in enumerate(offsets)
+	]
+
+
+# Column order of run_scenario_np / save_scenario_csv (same as rows_to_table)
+SCENARIO_COLUMNS = ("distance_m", "offset_mhz", "path_loss_db", "noise_dbm", "allowed_eirp_dbm")
+
+
+def run_scenario_np(spec: SpecParameters, scenario: Scenario) -> np.ndarray:
+	"""run_scenario as a float array of shape (N, 5), one row per distance/offset pair.
+
+	Columns follow SCENARIO_COLUMNS; rows are in the same order as run_scenario.
+	"""
+	distances, offsets, pl_db, n_dbm, eirp = _scenario_grid(spec, scenario)
+	n_d, n_o = eirp.shape
+	out = np.empty((n_d * n_o, 5), dtype=float)
+	out[:, 0] = np.repeat(np.asarray(distances, dtype=float), n_o)
+	out[:, 1] = np.tile(np.asarray(offsets, dtype=float), n_d)
+	out[:, 2] = np.repeat(pl_db, n_o)
+	out[:, 3] = n_dbm
+	out[:, 4] = eirp.ravel()
+	return out
+
+
+def save_scenario_csv(arr: np.ndarray, path: str | Path) -> None:
+	"""Save a run_scenario_np array to CSV with the rows_to_table formatting."""
+	np.savetxt(
+		Path(path),
+		arr,
+		fmt=("%.1f", "%d", "%.2f", "%.2f", "%.2f"),
+		delimiter=",",
+		header=",".join(SCENARIO_COLUMNS),
+		comments="",
+	)
 
 
 def rows_to_table(rows: Iterable[ResultRow]) -> List[List[str]]:
-	"""Convert results to a simple table (strings) for printing or CSV export."""
-	table = [["distance_m", "offset_mhz", "path_loss_db", "noise_dbm", "allowed_eirp_dbm"]]
+	"""Convert results to a simple table (strings) for printing.
+
+	For large scenarios prefer run_scenario_np + save_scenario_csv.
+	"""
+	table = [list(SCENARIO_COLUMNS)]
 	for r in rows:
 		table.append([
 			f"{r.distance_m:.1f}",
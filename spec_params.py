@@ -17,12 +17,20 @@ WINNF-TS-1014 references:
 - 9.1.2 Fixed Service Transmitter and Receiver Parameters (parsing NF/BW, G_rx, etc.)
 - Annex C: Reference Table for FS Receiver Parameters (mapping from ULS to parameters)
 """
+import heapq
+import os
 import re
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+from .acir_defaults import ensure_defaults
+
+
+@dataclass(frozen=True, slots=True)
 class IncumbentReceiverParams:
     noise_figure_db: float = 5.0
     bandwidth_hz: float = 20e6
@@ -31,27 +39,104 @@ class IncumbentReceiverParams:
     polarization_mismatch_db: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WiFiRegulatoryLimits:
     max_eirp_dbm: float = 36.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ACIRSpec:
-    # channel offset in MHz -> attenuation dB (Tx leakage and Rx selectivity)
-    a_tx_db_by_offset_mhz: Dict[int, float]
-    a_rx_db_by_offset_mhz: Dict[int, float]
+    # channel offset in MHz -> attenuation dB (Tx leakage and Rx selectivity); stored as
+    # read-only copies of the given dicts, so they cannot drift from the derived fields
+    a_tx_db_by_offset_mhz: Mapping[int, float]
+    a_rx_db_by_offset_mhz: Mapping[int, float]
+    # Mask points merged with the defaults (ensure_defaults) and sorted by offset,
+    # derived once at construction: as (offset, dB) tuples for the scalar mask
+    # helpers and as parallel arrays for np.interp
+    tx_points: Tuple[Tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+    rx_points: Tuple[Tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+    tx_offsets_mhz: np.ndarray = field(init=False, repr=False, compare=False)
+    tx_atten_db: np.ndarray = field(init=False, repr=False, compare=False)
+    rx_offsets_mhz: np.ndarray = field(init=False, repr=False, compare=False)
+    rx_atten_db: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "a_tx_db_by_offset_mhz", MappingProxyType(dict(self.a_tx_db_by_offset_mhz)))
+        object.__setattr__(self, "a_rx_db_by_offset_mhz", MappingProxyType(dict(self.a_rx_db_by_offset_mhz)))
+        a_tx, a_rx = ensure_defaults(self.a_tx_db_by_offset_mhz, self.a_rx_db_by_offset_mhz)
+        for side, table in (("tx", a_tx), ("rx", a_rx)):
+            points = tuple(sorted((float(k), float(v)) for k, v in table.items()))
+            offsets, atten = (np.array(col, dtype=float) for col in zip(*points))
+            offsets.flags.writeable = False
+            atten.flags.writeable = False
+            object.__setattr__(self, f"{side}_points", points)
+            object.__setattr__(self, f"{side}_offsets_mhz", offsets)
+            object.__setattr__(self, f"{side}_atten_db", atten)
 
+    def __reduce__(self):
+        # Mapping proxies do not pickle (specs go to process pools): rebuild from plain dicts
+        return (ACIRSpec, (dict(self.a_tx_db_by_offset_mhz), dict(self.a_rx_db_by_offset_mhz)))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SpecParameters:
     incumbent: IncumbentReceiverParams
     wifi_limits: WiFiRegulatoryLimits
     acir: ACIRSpec
 
 
+# Field patterns, compiled once at import
+_RE_NUMBER_WITH_UNIT = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*(Hz|kHz|MHz|GHz)", re.IGNORECASE)
+_RE_CENTER_FREQ = re.compile(r"(center\s*frequency|Fc|FS\s*-?Rx).*?([0-9]+(?:\.[0-9]+)?)\s*(GHz|MHz)", re.IGNORECASE | re.DOTALL)
+_RE_NF = re.compile(r"noise\s*figure\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+_RE_RX_BW = re.compile(r"(B[_ ]?Rx|receiver\s+bandwidth|noise\s+bandwidth)\s*[:=]\s*([^\n]+)", re.IGNORECASE)
+_RE_RX_GAIN = re.compile(r"incumbent\s*(antenna)?\s*gain\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dBi", re.IGNORECASE)
+_RE_RX_LOSSES = re.compile(r"rx\s*loss(es)?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+_RE_POLARIZATION = re.compile(r"polarizat(ion|ion mismatch)\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+_RE_MAX_EIRP = re.compile(r"max\s*EIRP\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dBm", re.IGNORECASE)
+_RE_ACIR = re.compile(r"ACIR\s*[±+\-]?\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+_RE_ACLR = re.compile(r"ACLR\s*at\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+_RE_ACS = re.compile(r"ACS\s*at\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", re.IGNORECASE)
+
+
+def _keyword_matches(pattern: "re.Pattern[str]", text: str, folded: str, keywords: tuple[str, ...], slack: int = 0):
+    """Yield the same matches as pattern.finditer(text), trying only at keyword hits.
+
+    Every pattern here starts with (or within `slack` chars of) one of its
+    keywords, so a match can only begin there. Keyword hits are found with
+    str.find on the casefolded text, which is far cheaper than a full
+    case-insensitive regex scan, and are merged lazily in text order so a
+    caller that only needs the first match stops scanning there. Falls back
+    to finditer on non-ASCII text: re.IGNORECASE matches letters such as the
+    dotless "ı" or the Kelvin sign to ASCII keywords, which casefold does not.
+    """
+    if not text.isascii():
+        yield from pattern.finditer(text)
+        return
+    # `tried` is the next untried position: candidates come out ascending and once only
+    tried = 0
+    for i in heapq.merge(*(_find_all(folded, kw) for kw in keywords)):
+        for pos in range(max(tried, i - slack), i + 1):
+            if pos < tried:
+                continue
+            m = pattern.match(text, pos)
+            if m:
+                yield m
+                # Matches do not overlap, as with finditer
+                tried = max(m.end(), pos + 1)
+        tried = max(tried, i + 1)
+
+
+def _find_all(haystack: str, needle: str):
+    # Start offsets of every (possibly overlapping) occurrence, ascending
+    i = haystack.find(needle)
+    while i >= 0:
+        yield i
+        i = haystack.find(needle, i + 1)
+
+
 def _parse_number_with_unit(value: str) -> Optional[float]:
-    m = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*(Hz|kHz|MHz|GHz)", value, re.IGNORECASE)
+    m = _RE_NUMBER_WITH_UNIT.search(value)
     if not m:
         return None
     num = float(m.group(1))
@@ -72,9 +157,18 @@ def parse_spec_text_to_params(text: str, defaults: Optional[SpecParameters] = No
             acir=ACIRSpec(a_tx_db_by_offset_mhz={20: 30.0, 40: 35.0}, a_rx_db_by_offset_mhz={20: 30.0, 40: 35.0}),
         )
 
+    # Patterns are only tried where their leading keyword occurs (see _keyword_matches)
+    folded = text.casefold()
+
+    def _finditer(pattern: "re.Pattern[str]", *keywords: str, slack: int = 0):
+        return _keyword_matches(pattern, text, folded, keywords, slack)
+
+    def _search(pattern: "re.Pattern[str]", *keywords: str, slack: int = 0) -> Optional["re.Match[str]"]:
+        return next(_finditer(pattern, *keywords, slack=slack), None)
+
     # Try to infer center frequency if present to apply NF default when not explicit.
     inferred_center_hz: Optional[float] = None
-    for m_cf in re.finditer(r"(center\s*frequency|Fc|FS\s*-?Rx).*?([0-9]+(?:\.[0-9]+)?)\s*(GHz|MHz)", text, re.IGNORECASE | re.DOTALL):
+    for m_cf in _finditer(_RE_CENTER_FREQ, "center", "fc", "fs"):
         try:
             num = float(m_cf.group(2))
             unit = m_cf.group(3).lower()
@@ -94,7 +188,7 @@ def parse_spec_text_to_params(text: str, defaults: Optional[SpecParameters] = No
     a_rx = dict(defaults.acir.a_rx_db_by_offset_mhz)
 
     # Noise figure
-    m = re.search(r"noise\s*figure\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE)
+    m = _search(_RE_NF, "noise")
     if m:
         nf_db = float(m.group(1))
     else:
@@ -106,44 +200,44 @@ def parse_spec_text_to_params(text: str, defaults: Optional[SpecParameters] = No
                 nf_db = 4.5
 
     # Receiver bandwidth
-    m = re.search(r"(B[_ ]?Rx|receiver\s+bandwidth|noise\s+bandwidth)\s*[:=]\s*([^\n]+)", text, re.IGNORECASE)
+    m = _search(_RE_RX_BW, "rx", "receiver", "noise", slack=2)
     if m:
         parsed = _parse_number_with_unit(m.group(2))
         if parsed:
             bw_hz = parsed
 
     # Incumbent antenna gain
-    m = re.search(r"incumbent\s*(antenna)?\s*gain\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dBi", text, re.IGNORECASE)
+    m = _search(_RE_RX_GAIN, "incumbent")
     if m:
         g_rx = float(m.group(2))
 
     # Rx losses
-    m = re.search(r"rx\s*loss(es)?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE)
+    m = _search(_RE_RX_LOSSES, "rx")
     if m:
         rx_losses = float(m.group(2))
 
     # Polarization
-    m = re.search(r"polarizat(ion|ion mismatch)\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE)
+    m = _search(_RE_POLARIZATION, "polarizat")
     if m:
         pol = float(m.group(2))
 
     # Max EIRP
-    m = re.search(r"max\s*EIRP\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dBm", text, re.IGNORECASE)
+    m = _search(_RE_MAX_EIRP, "max")
     if m:
         max_eirp = float(m.group(1))
 
     # ACIR lines like: "ACIR ±20 MHz: 27 dB" or "ACLR/ACS at 20 MHz: 30/35 dB"
-    for m in re.finditer(r"ACIR\s*[±+\-]?\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE):
+    for m in _finditer(_RE_ACIR, "acir"):
         offset = int(m.group(1))
         val = float(m.group(2))
         # Split evenly between Tx/Rx if only ACIR provided
         a_tx[offset] = val / 2.0
         a_rx[offset] = val / 2.0
 
-    for m in re.finditer(r"ACLR\s*at\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE):
+    for m in _finditer(_RE_ACLR, "aclr"):
         offset = int(m.group(1))
         a_tx[offset] = float(m.group(2))
-    for m in re.finditer(r"ACS\s*at\s*([0-9]+)\s*MHz\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\s*dB", text, re.IGNORECASE):
+    for m in _finditer(_RE_ACS, "acs"):
         offset = int(m.group(1))
         a_rx[offset] = float(m.group(2))
 
@@ -161,7 +255,20 @@ def parse_spec_text_to_params(text: str, defaults: Optional[SpecParameters] = No
 
 
 def load_params_from_text_file(path: str, defaults: Optional[SpecParameters] = None) -> SpecParameters:
+    if defaults is None:
+        # Loads of an unchanged file share one parse: SpecParameters is frozen all the
+        # way down (read-only ACIR mappings and arrays), so no caller can alter it
+        path = os.fspath(path)
+        return _load_params_cached(path, os.stat(path).st_mtime_ns)
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         txt = f.read()
     return parse_spec_text_to_params(txt, defaults)
 
+
+@lru_cache(maxsize=8)
+def _load_params_cached(path: str, mtime_ns: int) -> SpecParameters:
+    # mtime_ns is part of the key only, so an edited file is parsed again
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        txt = f.read()
+    return parse_spec_text_to_params(txt)
+
@@ -10,10 +10,13 @@ WINNF-TS-1014 alignment: wraps 9.1.1 evaluation with co/adjacent handling and
 the FS parameter precedence implemented elsewhere.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Iterable, Tuple, List, Dict, Any
 
 from .spec_params import SpecParameters
-from .grant_table import build_grant_table_with_incumbents
+from .grant_table import build_grant_table_with_incumbents, _normalize_incumbent_sites
 from .device_constraints import DeviceConstraints
 from .grant_table import grant_rows_to_table
 
@@ -32,31 +35,55 @@ def spectrum_inquiry(
     indoor: bool = False,
     penetration_db: float | None = None,
     protection_margin_db: float = 0.0,
+    max_workers: int | None = None,
 ):
     """Return combined grant rows (list) for the given AP and bands.
 
     Computes per-incumbent distances and antenna discrimination automatically.
+    Bands are independent; with max_workers > 1 and several bands they are built
+    in a process pool (rows keep the band order either way).
     """
+    band_ranges = list(band_ranges_mhz)
+    # Incumbent field resolution is band independent: do it once for all bands
+    sites = _normalize_incumbent_sites(spec, incumbents)
+    build = partial(
+        _build_band,
+        spec=spec,
+        sites=sites,
+        ap_lat=ap_lat,
+        ap_lon=ap_lon,
+        bandwidths_mhz=tuple(bandwidths_mhz),
+        inr_limit_db=inr_limit_db,
+        environment=environment,
+        path_model=path_model,
+        device_constraints=device_constraints,
+        indoor=indoor,
+        penetration_db=penetration_db,
+        protection_margin_db=protection_margin_db,
+    )
+    workers = min(max_workers or 1, len(band_ranges), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            per_band = list(ex.map(build, band_ranges))
+    else:
+        per_band = [build(band) for band in band_ranges]
     all_rows = []
-    for lo, hi in band_ranges_mhz:
-        rows = build_grant_table_with_incumbents(
-            spec=spec,
-            incumbents=incumbents,
-            distance_m=None,
-            ap_lat=ap_lat,
-            ap_lon=ap_lon,
-            lower_mhz=lo,
-            upper_mhz=hi,
-            bandwidths_mhz=bandwidths_mhz,
-            inr_limit_db=inr_limit_db,
-            environment=environment,
-            path_model=path_model,
-            device_constraints=device_constraints,
-            indoor=indoor,
-            penetration_db=penetration_db,
-            protection_margin_db=protection_margin_db,
-        )
+    for rows in per_band:
         all_rows.extend(rows)
     return all_rows
 
 
+def _build_band(band: Tuple[float, float], *, spec: SpecParameters, sites: List[tuple], ap_lat: float, ap_lon: float, **kwargs):
+    # One band's grant table from pre-normalized sites (module level so it pickles)
+    lo, hi = band
+    return build_grant_table_with_incumbents(
+        spec=spec,
+        incumbents=sites,
+        distance_m=None,
+        ap_lat=ap_lat,
+        ap_lon=ap_lon,
+        lower_mhz=lo,
+        upper_mhz=hi,
+        pre_normalized=True,
+        **kwargs,
+    )
@@ -1,19 +1,9 @@
-import json
-from pathlib import Path
-
 import afc_new as afc
 from afc_new.aggregate import evaluate_aggregate_inr_for_channel
 
 
-def _load_params_and_incumbents():
-    root = Path(__file__).resolve().parents[1]
-    params = afc.load_params_from_text_file(root / "spec" / "extracted_afc_text.txt")
-    incumbents = json.loads((root / "spec" / "example_incumbents.json").read_text(encoding="utf-8"))
-    return root, params, incumbents
-
-
-def test_aggregate_inr_cochannel_fails_adjacent_passes():
-    root, params, incumbents = _load_params_and_incumbents()
+def test_aggregate_inr_cochannel_fails_adjacent_passes(afc_params, incumbents_json):
+    params, incumbents = afc_params, incumbents_json
     aps = [
         {"lat": 41.015, "lon": 28.979, "eirp_dbm": 30.0},
         {"lat": 41.017, "lon": 28.990, "eirp_dbm": 27.0},
@@ -1,18 +1,8 @@
-from pathlib import Path
-import json
-
 import afc_new as afc
 
 
-def _load_params_and_incumbents():
-    root = Path(__file__).resolve().parents[1]
-    params = afc.load_params_from_text_file(root / "spec" / "extracted_afc_text.txt")
-    incumbents = json.loads((root / "spec" / "example_incumbents.json").read_text(encoding="utf-8"))
-    return root, params, incumbents
-
-
-def test_exact_band_center_forced():
-    root, params, incumbents = _load_params_and_incumbents()
+def test_exact_band_center_forced(afc_params, incumbents_json):
+    params, incumbents = afc_params, incumbents_json
     # Force a band equal to 20 MHz and ensure we get exactly one center evaluated
     rows = afc.build_grant_table_with_incumbents(
         spec=params,
@@ -31,8 +21,8 @@ def test_exact_band_center_forced():
     assert abs(rows[0].center_mhz - 6025.0) < 1e-6
 
 
-def test_tolerant_field_names():
-    root, params, incumbents = _load_params_and_incumbents()
+def test_tolerant_field_names(afc_params, incumbents_json):
+    params, incumbents = afc_params, incumbents_json
     # Rename fields to alternate variants and ensure it still works
     inc_alt = []
     for inc in incumbents:
@@ -1,19 +1,9 @@
-import json
-from pathlib import Path
-
 import afc_new as afc
 from afc_new.protocol import handle_available_spectrum_inquiry
 
 
-def _load_params_and_incumbents():
-    root = Path(__file__).resolve().parents[1]
-    params = afc.load_params_from_text_file(root / "spec" / "extracted_afc_text.txt")
-    incumbents = json.loads((root / "spec" / "example_incumbents.json").read_text(encoding="utf-8"))
-    return root, params, incumbents
-
-
-def test_frequency_based_bins_merge_off():
-    root, params, incumbents = _load_params_and_incumbents()
+def test_frequency_based_bins_merge_off(afc_params, incumbents_json):
+    params, incumbents = afc_params, incumbents_json
     req = {
         "location": {"lat": 41.015, "lon": 28.979},
         "inquiredFrequencyRange": [{"lowMHz": 5925.0, "highMHz": 5930.0}],
@@ -29,8 +19,8 @@ def test_frequency_based_bins_merge_off():
     assert len(afi) == 5
 
 
-def test_channel_based_with_bandwidth_fallback():
-    root, params, incumbents = _load_params_and_incumbents()
+def test_channel_based_with_bandwidth_fallback(afc_params, incumbents_json):
+    params, incumbents = afc_params, incumbents_json
     req = {
         "location": {"lat": 41.015, "lon": 28.979},
         "inquiredChannels": [
@@ -1,4 +1,4 @@
-from afc_new.acir_masks import interpolate_mask_db, acir_db_from_masks
+from afc_new.acir_masks import interpolate_mask_db, acir_db_from_masks, acir_db_from_masks_vec
 
 
 def test_interpolate_mask_db():
@@ -16,3 +16,11 @@ def test_acir_from_masks_reasonable():
     acir40 = acir_db_from_masks(40, tx, rx)
     assert acir40 > acir20
 
+
+def test_acir_from_masks_vec_matches_scalar():
+    tx = [(40, 35), (10, 20), (20, 30), (120, 50)]
+    rx = [(10, 18), (20, 30), (40, 35), (120, 48)]
+    offsets = [0.0, 10.0, 15.5, 20.0, 33.0, 40.0, 119.9, 500.0]
+    vec = acir_db_from_masks_vec(offsets, tx, rx)
+    for off, v in zip(offsets, vec):
+        assert abs(v - acir_db_from_masks(off, tx, rx)) < 1e-9
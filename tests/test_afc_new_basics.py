@@ -1,6 +1,6 @@
 import math
 
-from afc_new.link_budget import compute_eirp_dbm, noise_power_dbm, i_threshold_dbm, interference_margin_db
+from afc_new.link_budget import compute_eirp_dbm, noise_power_dbm, i_threshold_dbm, interference_margin_db, db_to_lin, lin_to_db
 from afc_new.fspl import fspl_db, invert_fspl_distance_m
 from afc_new.acir import acir_db, adjacent_channel_interference_dbm
 from afc_new.phy import sinr_db
@@ -22,6 +22,16 @@ def test_eirp_and_noise_and_threshold():
     assert abs(im - 3.0) < 1e-9
 
 
+def test_db_lin_conversions():
+    xs = [-120.0, -6.0, 0.0, 3.0, 36.0]
+    lin = db_to_lin(xs)
+    for x, v in zip(xs, lin):
+        assert abs(v - 10.0 ** (x / 10.0)) <= 1e-12 * 10.0 ** (x / 10.0)
+    back = lin_to_db(lin)
+    for x, v in zip(xs, back):
+        assert abs(v - x) < 1e-9
+
+
 def test_fspl_and_inverse():
     f = 6.0e9
     d = 100.0
@@ -1,15 +1,11 @@
-import sys
-import os
 import pytest
 
-# Add parent directory to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+# The project root is put on sys.path by the root conftest.py
 from core.afc import AFCEngine, AFCRequest, ResponseCode
 from core.phy import Antenna, Environment
 from core.afc_phy_interface import AFCPhyInterface
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def setup_objects():
     """Creates test objects for all test cases"""
     # Mock objects with test parameters
@@ -0,0 +1,50 @@
+from afc_new.geodesy import (
+    haversine_distance_m,
+    haversine_distance_m_vec,
+    haversine_distance_matrix_m,
+    initial_bearing_deg,
+    initial_bearing_deg_vec,
+)
+from afc_new.antenna import (
+    AntennaPatternParams,
+    off_axis_azimuth_deg,
+    off_axis_azimuth_deg_vec,
+    effective_gain_dbi,
+    effective_gain_dbi_vec,
+)
+
+
+def test_haversine_vec_matches_scalar():
+    lats = [41.05, 41.03, 41.0185, 40.0]
+    lons = [28.98, 28.96, 28.9905, 30.5]
+    d_vec = haversine_distance_m_vec(41.015, 28.979, lats, lons)
+    assert d_vec.shape == (4,)
+    for d, lat, lon in zip(d_vec, lats, lons):
+        assert abs(d - haversine_distance_m(41.015, 28.979, lat, lon)) < 1e-6
+
+
+def test_haversine_matrix_matches_scalar():
+    ap_lats, ap_lons = [41.015, 41.017], [28.979, 28.990]
+    lats = [41.05, 41.03, 40.0]
+    lons = [28.98, 28.96, 30.5]
+    d = haversine_distance_matrix_m(ap_lats, ap_lons, lats, lons)
+    assert d.shape == (2, 3)
+    for i in range(2):
+        for j in range(3):
+            assert abs(d[i, j] - haversine_distance_m(ap_lats[i], ap_lons[i], lats[j], lons[j])) < 1e-6
+
+
+def test_bearing_and_gain_vec_match_scalar():
+    lats = [41.05, 41.03, 41.0185, 40.0, 41.015]
+    lons = [28.98, 28.96, 28.9905, 30.5, 28.979]
+    az = [0.0, 90.0, 200.0, 359.0, 45.0]
+    gains = [38.0, 30.0, 32.0, 25.0, 41.0]
+    brg = initial_bearing_deg_vec(41.015, 28.979, lats, lons)
+    delta = off_axis_azimuth_deg_vec(az, (brg + 180.0) % 360.0)
+    g_vec = effective_gain_dbi_vec(gains, delta, 0.0)
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        b = initial_bearing_deg(41.015, 28.979, lat, lon)
+        assert abs(brg[i] - b) < 1e-9
+        d = off_axis_azimuth_deg(az[i], (b + 180.0) % 360.0)
+        assert abs(delta[i] - d) < 1e-9
+        assert abs(g_vec[i] - effective_gain_dbi(AntennaPatternParams(g_max_dbi=gains[i]), d, 0.0)) < 1e-9
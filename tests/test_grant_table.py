@@ -1,4 +1,12 @@
-from afc_new.grant_table import enumerate_centers_mhz, channel_number_from_center_mhz, build_grant_table_for_hypothetical_fs
+from afc_new.grant_table import (
+    enumerate_centers_mhz,
+    channel_number_from_center_mhz,
+    channel_numbers_from_centers_mhz,
+    build_grant_table_for_hypothetical_fs,
+    build_grant_table_with_incumbents,
+    evaluate_channels_batch,
+    _normalize_incumbent_sites,
+)
 from afc_new.spec_params import SpecParameters, IncumbentReceiverParams, WiFiRegulatoryLimits, ACIRSpec
 
 
@@ -24,3 +32,49 @@ def test_build_grant_table_basic():
     assert r0.center_mhz > 0
     assert r0.allowed_psd_dbm_per_mhz == r0.allowed_eirp_dbm - 10.0
 
+
+def test_pre_normalized_sites_match_raw_incumbents():
+    params = SpecParameters(
+        incumbent=IncumbentReceiverParams(noise_figure_db=4.5, bandwidth_hz=20e6, antenna_gain_dbi=30.0, rx_losses_db=1.0, polarization_mismatch_db=0.0),
+        wifi_limits=WiFiRegulatoryLimits(max_eirp_dbm=36.0),
+        acir=ACIRSpec(a_tx_db_by_offset_mhz={20: 30.0, 40: 35.0}, a_rx_db_by_offset_mhz={20: 30.0, 40: 35.0}),
+    )
+    incs = [
+        {"fs_center_mhz": 6175.0, "rx_bw_mhz": 30.0, "lat": 41.02, "lon": 28.99, "fs_id": "A",
+         "passive_sites": [{"lat": 41.03, "lon": 29.0}]},
+        {"freq_center_mhz": 6300.0, "bandwidth_mhz": 10.0, "rx_lat": 41.01, "rx_lon": 28.97, "polarization": "V"},
+    ]
+    sites = _normalize_incumbent_sites(params, incs)
+    assert [s[-1] for s in sites] == ["A", "A:PS1", "unknown"]
+    kw = dict(ap_lat=41.015, ap_lon=28.979, bandwidths_mhz=(20.0, 40.0), environment="urban")
+    raw = build_grant_table_with_incumbents(params, incs, **kw)
+    pre = build_grant_table_with_incumbents(params, sites, pre_normalized=True, **kw)
+    assert pre == raw
+
+
+def test_channel_numbers_vec_matches_scalar():
+    centers = enumerate_centers_mhz(5925.0, 7125.0, 20.0) + enumerate_centers_mhz(5925.0, 7125.0, 160.0)
+    nums = channel_numbers_from_centers_mhz(centers)
+    assert nums.dtype.kind == "i"
+    assert nums.tolist() == [channel_number_from_center_mhz(c) for c in centers]
+
+
+def test_evaluate_channels_batch_matches_single_channel_tables():
+    params = SpecParameters(
+        incumbent=IncumbentReceiverParams(noise_figure_db=4.5, bandwidth_hz=20e6, antenna_gain_dbi=30.0, rx_losses_db=1.0, polarization_mismatch_db=0.0),
+        wifi_limits=WiFiRegulatoryLimits(max_eirp_dbm=36.0),
+        acir=ACIRSpec(a_tx_db_by_offset_mhz={20: 30.0, 40: 35.0}, a_rx_db_by_offset_mhz={20: 30.0, 40: 35.0}),
+    )
+    incs = [
+        {"freq_center_mhz": 6175.0, "bandwidth_mhz": 30.0, "rx_lat": 41.02, "rx_lon": 28.99, "polarization": "H"},
+        {"freq_center_mhz": 6300.0, "bandwidth_mhz": 10.0, "rx_lat": 41.01, "rx_lon": 28.97},
+    ]
+    channels = [(6175.0, 20.0), (6215.0, 40.0), (6295.0, 20.0), (6135.0, 20.0)]
+    got = evaluate_channels_batch(params, incs, 41.015, 28.979, [c for c, _ in channels], [b for _, b in channels], environment="urban")
+    assert got.shape == (len(channels),)
+    for (fc, bw), eirp in zip(channels, got):
+        rows = build_grant_table_with_incumbents(
+            params, incs, ap_lat=41.015, ap_lon=28.979, lower_mhz=fc - bw / 2.0, upper_mhz=fc + bw / 2.0,
+            bandwidths_mhz=(bw,), environment="urban",
+        )
+        assert abs(rows[0].allowed_eirp_dbm - eirp) < 1e-9
@@ -0,0 +1,23 @@
+from afc_new.incumbent_table import POL_H, POL_UNKNOWN, normalize_incumbents
+
+
+def test_normalize_incumbents_resolves_aliases():
+    incs = [
+        {"freq_center_mhz": 6175.0, "bandwidth_mhz": 30.0, "rx_lat": 41.05, "rx_lon": 28.98,
+         "rx_antenna_gain_dbi": 38.0, "rx_azimuth_deg": 90.0, "polarization": "h"},
+        {"center_mhz": 6300.0, "fs_bandwidth_mhz": 10.0, "lat": 41.0, "lon": 29.0,
+         "rx_rpe_az": [(0.0, 0.0), (10.0, 20.0)], "rx_rpe_el": [(0.0, 0.0), (10.0, 20.0)]},
+    ]
+    t = normalize_incumbents(incs, default_rx_gain_dbi=32.0)
+    assert len(t) == 2
+    assert t.center_mhz.tolist() == [6175.0, 6300.0]
+    assert t.bw_mhz.tolist() == [30.0, 10.0]
+    assert t.lat.tolist() == [41.05, 41.0]
+    assert t.rx_gain_dbi.tolist() == [38.0, 32.0]
+    assert t.rx_az_deg.tolist() == [90.0, 0.0]
+    assert t.pol.dtype == "uint8"
+    assert t.pol.tolist() == [POL_H, POL_UNKNOWN]
+    assert t.pol_loss_db.tolist() == [3.0, 0.0]
+    assert t.has_rpe.tolist() == [False, True]
+    assert t.rpe_az[0] is None
+    assert t.link_id == ["unknown", "unknown"]
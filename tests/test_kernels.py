@@ -0,0 +1,73 @@
+import numpy as np
+
+from afc_new.kernels import freq_bin_min_eirp_kernel, grant_min_eirp_kernel
+from afc_new.propagation import select_pathloss_db
+from afc_new.acir_masks import acir_db_from_masks
+
+
+def test_freq_bin_kernel_matches_scalar_reference():
+    lo = np.arange(5990.0, 6060.0)
+    hi = lo + 1.0
+    center = lo + 0.5
+    dist = np.array([800.0, 12000.0])
+    fc = np.array([6025.0, 6040.0])
+    bw = np.array([20.0, 10.0])
+    pol = np.array([3.0, 0.0])
+    tx = [(10.0, 20.0), (20.0, 30.0), (40.0, 35.0)]
+    rx = [(10.0, 18.0), (20.0, 30.0), (40.0, 35.0)]
+    tx_x, tx_y = (np.array(v) for v in zip(*tx))
+    rx_x, rx_y = (np.array(v) for v in zip(*rx))
+    i_thr, g_rx, l_rx, cap = -104.0, 30.0, 1.0, 36.0
+
+    best = freq_bin_min_eirp_kernel(
+        lo, hi, center, dist, fc, fc - bw / 2.0, fc + bw / 2.0, pol,
+        8.0, 5000.0, i_thr, g_rx, l_rx, cap, tx_x, tx_y, rx_x, rx_y,
+    )
+
+    for b in range(lo.size):
+        ref = cap
+        for i in range(dist.size):
+            pl = select_pathloss_db(dist[i], center[b] * 1e6, environment="urban")
+            eirp = min(i_thr + pl - g_rx + l_rx + pol[i], cap)
+            if min(hi[b], fc[i] + bw[i] / 2.0) - max(lo[b], fc[i] - bw[i] / 2.0) <= 0:
+                eirp += acir_db_from_masks(abs(center[b] - fc[i]), tx, rx)
+            ref = min(ref, eirp)
+        assert abs(best[b] - ref) < 1e-9
+
+
+def test_grant_kernel_picks_first_strict_minimum():
+    pl = np.array([[100.0, 90.0, 92.0], [200.0, 200.0, 200.0]])
+    adjacent = np.array([[False, True, False], [False, False, False]])
+    acir = np.full((2, 3), 5.0)
+    pol = np.array([0.0, 0.0, 3.0])
+    i_thr, g_rx, l_rx, cap = -100.0, 30.0, 0.0, 36.0
+
+    best, arg = grant_min_eirp_kernel(pl, adjacent, acir, pol, i_thr, g_rx, l_rx, cap)
+
+    # -30 (co), -40 + 5 (adj), -38 + 3 (co, H/V): tie at -35, the first site wins
+    assert abs(best[0] - (-35.0)) < 1e-12
+    assert arg[0] == 1
+    # Every site above the cap: nothing is limiting
+    assert best[1] == cap
+    assert arg[1] == -1
+
+
+def test_grant_tiled_numpy_matches_kernel():
+    from afc_new.grant_table import _min_eirp_tiled
+
+    rng = np.random.default_rng(0)
+    n_ch, n_site = 70, 150  # several channel and site blocks
+    pl = rng.uniform(80.0, 160.0, (n_ch, n_site))
+    pl[:, 100] = pl[:, 10]  # ties across site blocks
+    adjacent = rng.random((n_ch, n_site)) < 0.5
+    adjacent[:, 100] = adjacent[:, 10]
+    acir = rng.uniform(20.0, 40.0, (n_ch, n_site))
+    acir[:, 100] = acir[:, 10]
+    pol = np.where(rng.random(n_site) < 0.5, 3.0, 0.0)
+    pol[100] = pol[10]
+    args = (pl, adjacent, acir, pol, -100.0, 30.0, 1.0, 36.0)
+
+    best_k, arg_k = grant_min_eirp_kernel(*args)
+    best_t, arg_t = _min_eirp_tiled(*args)
+    assert np.array_equal(best_k, best_t)
+    assert np.array_equal(arg_k, arg_t)
@@ -1,4 +1,7 @@
-from afc_new.propagation import select_pathloss_db, winner2_pathloss_db, itm_pathloss_db
+import numpy as np
+
+from afc_new.propagation import select_pathloss_db, select_pathloss_db_vec, winner2_pathloss_db, itm_pathloss_db, clear_pathloss_caches
+from afc_new.itm import longley_rice_pathloss_db
 from afc_new.kpi import inr_violation_probability
 
 
@@ -21,3 +24,28 @@ def test_inr_violation_probability():
     # Violations are those > -6: (-5, -3) => 2/5 = 0.4
     assert abs(p - 0.4) < 1e-9
 
+
+
+def test_select_pathloss_cache_is_exact():
+    f = 6.0e9
+    a = select_pathloss_db(1234.5, f, environment="urban")
+    b = select_pathloss_db(1234.6, f, environment="urban")
+    assert a != b
+    assert select_pathloss_db(1234.5, f, environment="urban") == a
+
+
+def test_select_pathloss_vec_matches_scalar():
+    d = np.array([10.0, 800.0, 4999.0, 5000.0, 25000.0])
+    f = np.array([5.93e9, 6.1e9, 6.4e9, 6.6e9, 7.1e9])
+    for selector in (None, "fspl", "winner2", "itm"):
+        pl_vec = select_pathloss_db_vec(d, f, selector, environment="urban", indoor=True)
+        pl = [select_pathloss_db(a, b, selector, environment="urban", indoor=True) for a, b in zip(d, f)]
+        assert np.allclose(pl_vec, pl, rtol=0.0, atol=1e-9)
+
+
+def test_clear_pathloss_caches():
+    pl = longley_rice_pathloss_db(2500.0, 6.1e9, tx_height_m=10.0, climate="urban")
+    select_pathloss_db(2500.0, 6.1e9)
+    clear_pathloss_caches()
+    assert longley_rice_pathloss_db.cache_info().currsize == 0
+    assert longley_rice_pathloss_db(2500.0, 6.1e9, tx_height_m=10.0, climate="urban") == pl
@@ -0,0 +1,90 @@
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+
+from afc_new.protocol import _coalesce_psd_runs, handle_available_spectrum_inquiry, nru_cfi_to_center_mhz, nru_cfi_to_center_mhz_vec
+from afc_new.spec_params import SpecParameters, IncumbentReceiverParams, WiFiRegulatoryLimits, ACIRSpec
+
+
+def _params():
+    return SpecParameters(
+        incumbent=IncumbentReceiverParams(noise_figure_db=4.5, bandwidth_hz=20e6, antenna_gain_dbi=30.0, rx_losses_db=1.0, polarization_mismatch_db=0.0),
+        wifi_limits=WiFiRegulatoryLimits(max_eirp_dbm=36.0),
+        acir=ACIRSpec(a_tx_db_by_offset_mhz={20: 30.0, 40: 35.0}, a_rx_db_by_offset_mhz={20: 30.0, 40: 35.0}),
+    )
+
+
+INCUMBENTS = [{"freq_center_mhz": 6000.0, "bandwidth_mhz": 30.0, "rx_lat": 41.02, "rx_lon": 28.99, "polarization": "H"}]
+
+
+def test_frequency_inquiry_json_bytes_match_dict():
+    req = {"location": {"lat": 41.015, "lon": 28.979}, "inquiredFrequencyRange": [{"lowMHz": 5980.0, "highMHz": 6030.0}]}
+    resp = handle_available_spectrum_inquiry(request=dict(req), spec=_params(), incumbents=INCUMBENTS)
+    body = handle_available_spectrum_inquiry(request=dict(req), spec=_params(), incumbents=INCUMBENTS, return_json_bytes=True)
+    assert isinstance(body, bytes)
+    decoded = json.loads(body)
+    assert decoded["responseCode"] == 0
+    assert decoded["availableFrequencyInfo"] == resp["availableFrequencyInfo"]
+
+
+def test_cfi_to_center_vec_matches_scalar():
+    cfis = [600000, 636996, 637000, 637100, 651333]
+    assert nru_cfi_to_center_mhz_vec(cfis).tolist() == [nru_cfi_to_center_mhz(c) for c in cfis]
+
+
+def test_coalesce_psd_runs():
+    lo = np.arange(6000.0, 6006.0)
+    psd = np.array([1.0, 1.0, 2.0, 2.0 + 1e-9, 1.0, 1.0])
+    lo_m, hi_m, psd_m = _coalesce_psd_runs(lo, lo + 1.0, psd, 1e-6)
+    assert lo_m.tolist() == [6000.0, 6002.0, 6004.0]
+    assert hi_m.tolist() == [6002.0, 6004.0, 6006.0]
+    assert psd_m.tolist() == [1.0, 2.0, 1.0]
+
+
+def test_coalesce_psd_runs_breaks_on_drift():
+    # Each step is below tol but the steps add up past it: the run must split
+    lo = np.arange(6000.0, 6004.0)
+    psd = np.array([0.0, 0.4, 0.8, 1.2])
+    lo_m, hi_m, psd_m = _coalesce_psd_runs(lo, lo + 1.0, psd, 0.5)
+    assert lo_m.tolist() == [6000.0, 6002.0]
+    assert hi_m.tolist() == [6002.0, 6004.0]
+    for lo_r, hi_r, p in zip(lo_m, hi_m, psd_m):
+        inside = psd[(lo >= lo_r) & (lo + 1.0 <= hi_r)]
+        assert p <= inside.min()
+
+
+def test_coalesce_psd_runs_long_drifting_sweep():
+    # 1200 bins drifting 0.3 dB per bin: every step merges on its own, the sum does not
+    lo = np.arange(5925.0, 7125.0)
+    psd = 0.3 * np.arange(lo.size)
+    lo_m, hi_m, psd_m = _coalesce_psd_runs(lo, lo + 1.0, psd, 1.0)
+    assert lo_m.tolist() == lo[::4].tolist()
+    assert hi_m.tolist() == (lo[3::4] + 1.0).tolist()
+    assert psd_m.tolist() == psd[::4].tolist()
+
+
+def test_coalesce_psd_runs_matches_run_start_loop():
+    # Mixed inputs exercise both the np.diff segments and the per-bin fallback, including
+    # a step >= tol back to within tol of the run start ([0, 0.4, -0.1] with tol 0.5)
+    rng = np.random.default_rng(7)
+    cases = [np.array([0.0, 0.4, -0.1, -0.1])]
+    cases += [rng.normal(0.0, 1.0, 40), np.cumsum(rng.uniform(-0.3, 0.3, 40)), np.round(rng.normal(0.0, 2.0, 40))]
+    for psd in cases:
+        lo = np.arange(psd.size, dtype=float)
+        for tol in (1e-6, 0.5, 1.0):
+            expected = []
+            for lo_b, p in zip(lo.tolist(), psd.tolist()):
+                if expected and abs(p - expected[-1][2]) < tol:
+                    expected[-1][1] = lo_b + 1.0
+                else:
+                    expected.append([lo_b, lo_b + 1.0, p])
+            lo_m, hi_m, psd_m = _coalesce_psd_runs(lo, lo + 1.0, psd, tol)
+            assert [list(r) for r in zip(lo_m.tolist(), hi_m.tolist(), psd_m.tolist())] == expected
+
+
+def test_expiry_uses_shared_now():
+    req = {"location": {"lat": 41.015, "lon": 28.979}, "inquiredFrequencyRange": [{"lowMHz": 5980.0, "highMHz": 5990.0}]}
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    resp = handle_available_spectrum_inquiry(request=dict(req), spec=_params(), incumbents=INCUMBENTS, now=now)
+    assert resp["availabilityExpireTime"] == "2024-01-01T00:15:00Z"
@@ -0,0 +1,21 @@
+from afc_new.rpe_loader import load_rpe_csv, load_rpe_csv_np
+
+
+def test_load_rpe_csv_header_separators_and_sort(tmp_path):
+    p = tmp_path / "rpe.csv"
+    p.write_text("angle_deg;attenuation_db\n10;20\n# comment\n\n0,0\n5 , 3.5\n", encoding="utf-8")
+    assert load_rpe_csv(p) == [(0.0, 0.0), (5.0, 3.5), (10.0, 20.0)]
+    assert load_rpe_csv_np(p).shape == (3, 2)
+
+
+def test_load_rpe_csv_skips_malformed_rows(tmp_path):
+    p = tmp_path / "rpe.csv"
+    p.write_text("0,0\nbad row\n1,1.5\n", encoding="utf-8")
+    assert load_rpe_csv(p) == [(0.0, 0.0), (1.0, 1.5)]
+
+
+def test_load_rpe_csv_drops_rows_with_inline_comments(tmp_path):
+    p = tmp_path / "rpe.csv"
+    p.write_text("0,0\n1,1.5 # note\n2,3\n", encoding="utf-8")
+    assert load_rpe_csv(p) == [(0.0, 0.0), (2.0, 3.0)]
+    assert load_rpe_csv_np(p).tolist() == [[0.0, 0.0], [2.0, 3.0]]
@@ -1,5 +1,5 @@
 from afc_new.spec_params import SpecParameters, IncumbentReceiverParams, WiFiRegulatoryLimits, ACIRSpec
-from afc_new.scenario import Scenario, run_scenario, rows_to_table
+from afc_new.scenario import Scenario, run_scenario, run_scenario_np, save_scenario_csv, rows_to_table
 
 
 def test_scenario_basic():
@@ -17,3 +17,20 @@ def test_scenario_basic():
 	assert adj.allowed_eirp_dbm > co.allowed_eirp_dbm
 	table = rows_to_table(rows)
 	assert table[0] == ["distance_m", "offset_mhz", "path_loss_db", "noise_dbm", "allowed_eirp_dbm"]
+
+
+def test_scenario_np_matches_rows(tmp_path):
+	params = SpecParameters(
+		incumbent=IncumbentReceiverParams(noise_figure_db=4.5, bandwidth_hz=20e6, antenna_gain_dbi=30.0, rx_losses_db=1.0, polarization_mismatch_db=0.0),
+		wifi_limits=WiFiRegulatoryLimits(max_eirp_dbm=36.0),
+		acir=ACIRSpec(a_tx_db_by_offset_mhz={20: 30.0}, a_rx_db_by_offset_mhz={20: 30.0}),
+	)
+	scn = Scenario(frequency_hz=6.0e9, distances_m=[100.0, 1000.0, 8000.0], channel_offsets_mhz=[0, 20])
+	rows = run_scenario(params, scn)
+	arr = run_scenario_np(params, scn)
+	assert arr.shape == (6, 5)
+	assert arr.tolist() == [[r.distance_m, r.channel_offset_mhz, r.path_loss_db, r.noise_dbm, r.allowed_eirp_dbm] for r in rows]
+	out = tmp_path / "scenario.csv"
+	save_scenario_csv(arr, out)
+	lines = out.read_text().splitlines()
+	assert lines == [",".join(row) for row in rows_to_table(rows)]
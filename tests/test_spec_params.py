@@ -1,4 +1,16 @@
-from afc_new.spec_params import parse_spec_text_to_params
+import os
+import pickle
+
+import pytest
+
+from afc_new.spec_params import (
+    ACIRSpec,
+    _RE_ACIR,
+    _RE_RX_BW,
+    _keyword_matches,
+    load_params_from_text_file,
+    parse_spec_text_to_params,
+)
 
 
 def test_parse_spec_text_simple():
@@ -27,6 +39,13 @@ def test_parse_spec_text_simple():
     assert params.acir.a_rx_db_by_offset_mhz[40] == 37.0
 
 
+def test_parse_spec_text_non_ascii_keywords():
+    # re.IGNORECASE matches the dotless "ı" to i/I; casefold leaves it as is
+    params = parse_spec_text_to_params("ACıR 20 MHz: 10 dB\nıncumbent gain: 40 dBi\n")
+    assert params.incumbent.antenna_gain_dbi == 40.0
+    assert params.acir.a_tx_db_by_offset_mhz[20] == 5.0
+
+
 def test_nf_default_by_center_frequency():
     text_low = "Fc, FS-Rx: 6.3 GHz\n(omitting NF explicit)"
     params_low = parse_spec_text_to_params(text_low)
@@ -36,3 +55,60 @@ def test_nf_default_by_center_frequency():
     params_high = parse_spec_text_to_params(text_high)
     assert params_high.incumbent.noise_figure_db == 4.5
 
+
+def test_acir_spec_sorted_mask_arrays():
+    acir = ACIRSpec(a_tx_db_by_offset_mhz={40: 36.0, 20: 27.0}, a_rx_db_by_offset_mhz={})
+    # Merged with the defaults (explicit entries win) and sorted by offset
+    assert acir.tx_points[:4] == ((10.0, 20.0), (20.0, 27.0), (30.0, 33.0), (40.0, 36.0))
+    assert acir.tx_offsets_mhz.tolist() == [p[0] for p in acir.tx_points]
+    assert acir.rx_atten_db.tolist() == [p[1] for p in acir.rx_points]
+    assert acir == ACIRSpec(a_tx_db_by_offset_mhz={20: 27.0, 40: 36.0}, a_rx_db_by_offset_mhz={})
+
+
+def test_acir_spec_masks_are_read_only():
+    tx = {20: 27.0}
+    acir = ACIRSpec(a_tx_db_by_offset_mhz=tx, a_rx_db_by_offset_mhz={})
+    tx[20] = 1.0
+    assert acir.a_tx_db_by_offset_mhz[20] == 27.0 == acir.tx_points[1][1]
+    with pytest.raises(TypeError):
+        acir.a_tx_db_by_offset_mhz[20] = 1.0
+    # Specs cross process pools, so they still pickle
+    assert pickle.loads(pickle.dumps(acir)) == acir
+
+
+def test_load_params_from_text_file_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "spec.txt"
+    path.write_text("Noise Figure: 7 dB\n")
+    first = load_params_from_text_file(str(path))
+    assert load_params_from_text_file(path) is first
+    path.write_text("Noise Figure: 5 dB\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = load_params_from_text_file(str(path))
+    assert second is not first
+    assert second.incumbent.noise_figure_db == 5.0
+
+
+def test_load_params_from_text_file_shared_masks_cannot_change(tmp_path):
+    path = tmp_path / "spec.txt"
+    path.write_text("ACIR 20 MHz: 10 dB\n")
+    first = load_params_from_text_file(str(path))
+    with pytest.raises(TypeError):
+        first.acir.a_tx_db_by_offset_mhz[20] = 99.0
+    with pytest.raises(ValueError):
+        first.acir.tx_atten_db[0] = 99.0
+    assert load_params_from_text_file(str(path)).acir.a_tx_db_by_offset_mhz[20] == 5.0
+
+
+def test_keyword_matches_agree_with_finditer():
+    texts = (
+        "B_Rx = 200 kHz\nACIR 20 MHz: 10 dBACIR +40 MHz = 30 dB\nreceiver bandwidth: 40 MHz rx Noise Bandwidth: 1 GHz",
+        "b_rX = 5 MHz\naCiR 20 MHz: 10 dB\nReCeIvEr BaNdWiDtH: 40 MHz",
+        # Non-ASCII: re.IGNORECASE matches the dotless "ı" to i, casefold keeps it
+        "ACıR 20 MHz: 10 dB\nNoıse bandwidth: 200 kHz\nB_Rx = 1 GHz\nACIR 40 MHz: 30 dB",
+    )
+    for text in texts:
+        folded = text.casefold()
+        for pattern, keywords, slack in ((_RE_RX_BW, ("rx", "receiver", "noise"), 2), (_RE_ACIR, ("acir",), 0)):
+            got = [m.span() for m in _keyword_matches(pattern, text, folded, keywords, slack)]
+            assert got == [m.span() for m in pattern.finditer(text)]